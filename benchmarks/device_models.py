@@ -0,0 +1,177 @@
+"""Benchmark parsing devices into typed models against keeping their properties as dicts.
+
+Builds a synthetic house of thermostats, cameras, smoke detectors and locks,
+parses it both ways and compares the memory the devices hold on to, how long
+a poll's worth of parsing takes, and how long entities take to read their
+properties. Run from the repository root:
+
+    python3 -m benchmarks.device_models --devices 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.device.base import BaseDevice
+
+BASE_PROPERTIES = {
+    "model": "Synthetic",
+    "roomId": "room",
+    "roomName": "Room",
+    "structureId": "structure",
+    "structureName": "Home",
+    "isOnline": True,
+}
+
+CATEGORY_PROPERTIES = {
+    "thermostat": {
+        "type": "thermostat", "currentTemperature": 21.0, "targetTemperature": 20.5,
+        "targetHeatingThresholdTemperature": 18.0, "targetCoolingThresholdTemperature": 23.0, "hvacMode": "heat",
+        "hvacState": "off", "canHeat": True, "canCool": True, "canHeatCool": True, "canHumidify": False,
+        "canDehumidify": False, "humidityPercent": 51.2, "fanRunning": False, "presetSelected": "",
+        "presetsAvailable": "Comfort,Eco,Sleep", "sensorSelected": "Room", "sensorsAvailable": "Room",
+    },
+    "cam": {
+        "type": "camera", "cameraEnabled": True, "supportsWebRtcStreaming": True, "rtspStreamingEnabled": False,
+        "motionDetected": False, "personDetected": False, "animalDetected": False, "vehicleDetected": False,
+        "soundDetected": False, "doorbellPushed": False, "packageDelivered": False, "packageRetrieved": False,
+        "quietTime": False,
+    },
+    "smoke_co_detector": {
+        "type": "smoke_detector", "smokeDetected": False, "coDetected": False, "batteryStatus": "normal",
+        "batteryLevel": 100, "manualTestActive": False, "smokeStateDetail": "ok", "coLevel": 0, "alarmSilenced": False,
+    },
+    "lock": {
+        "type": "lock", "currentState": "locked", "targetState": "locked", "batteryLevel": 100, "batteryStatus": "normal",
+    },
+}
+
+# The properties each entity reads on every state write
+READ_PROPERTIES = {
+    "thermostat": ["isOnline", "currentTemperature", "targetTemperature", "hvacMode", "hvacState", "fanRunning"],
+    "cam": ["isOnline", "cameraEnabled", "motionDetected", "personDetected"],
+    "smoke_co_detector": ["isOnline", "smokeDetected", "coDetected", "batteryLevel"],
+    "lock": ["isOnline", "currentState", "targetState"],
+}
+
+
+@dataclass
+class DictDevice:
+    """A device as it was before parsing, with its properties left as a dict."""
+
+    status: str
+    properties: dict[str, Any]
+
+
+def make_payloads(device_count: int) -> list[bytes]:
+    """Make the device payloads of a synthetic house, as the hub would send them."""
+    categories = list(CATEGORY_PROPERTIES)
+    payloads = []
+
+    for index in range(device_count):
+        category = categories[index % len(categories)]
+        properties = {
+            "category": category, "id": f"{category}-{index}", "name": f"Device {index}", "serialNumber": str(index),
+            **BASE_PROPERTIES, **CATEGORY_PROPERTIES[category],
+        }
+        payloads.append(json.dumps({"status": "OK", "properties": properties}).encode())
+
+    return payloads
+
+
+def parse_dict(payload: bytes) -> DictDevice:
+    """Parse a payload the way devices were parsed before."""
+    return DictDevice(**json.loads(payload))
+
+
+def parse_typed(payload: bytes) -> Device:
+    """Parse a payload into its typed model."""
+    return Device.create_from_dict(json.loads(payload))
+
+
+def measure_memory(payloads: list[bytes], parse: Callable[[bytes], Any]) -> int:
+    """Measure how many bytes the parsed devices hold on to."""
+    gc.collect()
+    tracemalloc.start()
+    devices = [parse(payload) for payload in payloads]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del devices
+
+    return retained
+
+
+def read_dict(devices: list[DictDevice]) -> None:
+    """Read properties the way entities did, checking each one is there first."""
+    for device in devices:
+        properties = device.properties
+        for key in READ_PROPERTIES[properties["category"]]:
+            if key in properties:
+                properties[key]
+
+
+def read_typed(devices: list[Device]) -> None:
+    """Read properties as attributes of the typed models."""
+    for device in devices:
+        properties = device.properties
+        if type(properties) is BaseDevice:
+            # Categories without a model of their own are still read as a mapping
+            for key in READ_PROPERTIES[properties.category]:
+                properties.get(key)
+        else:
+            for key in READ_PROPERTIES[properties.category]:
+                getattr(properties, key)
+
+
+def read_typed_mapping(devices: list[Device]) -> None:
+    """Read properties of the typed models through their mapping interface, as untouched callers do."""
+    for device in devices:
+        properties = device.properties
+        for key in READ_PROPERTIES[properties["category"]]:
+            if key in properties:
+                properties[key]
+
+
+def time_best(fn: Callable[[], Any], repeat: int) -> float:
+    """Time the fastest of a number of runs in seconds."""
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    payloads = make_payloads(args.devices)
+    dict_devices = [parse_dict(payload) for payload in payloads]
+    typed_devices = [parse_typed(payload) for payload in payloads]
+    reads = sum(len(READ_PROPERTIES[device.properties["category"]]) for device in dict_devices)
+
+    print(f"{args.devices} devices, {reads} property reads per pass")
+
+    dict_memory = measure_memory(payloads, parse_dict)
+    typed_memory = measure_memory(payloads, parse_typed)
+    print(f"memory: dict={dict_memory / 1024:.0f} KiB typed={typed_memory / 1024:.0f} KiB "
+          f"({typed_memory / dict_memory:.0%} of dict)")
+
+    dict_parse = time_best(lambda: [parse_dict(payload) for payload in payloads], args.repeat)
+    typed_parse = time_best(lambda: [parse_typed(payload) for payload in payloads], args.repeat)
+    print(f"parse:  dict={dict_parse * 1000:.2f}ms typed={typed_parse * 1000:.2f}ms")
+
+    dict_read = time_best(lambda: read_dict(dict_devices), args.repeat)
+    typed_read = time_best(lambda: read_typed(typed_devices), args.repeat)
+    mapping_read = time_best(lambda: read_typed_mapping(typed_devices), args.repeat)
+    print(f"read:   dict={dict_read * 1000:.2f}ms typed={typed_read * 1000:.2f}ms "
+          f"typed as mapping={mapping_read * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
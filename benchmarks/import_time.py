@@ -0,0 +1,89 @@
+"""Benchmark how long importing the integration takes.
+
+Imports the package in a fresh interpreter under `python -X importtime`,
+as Home Assistant does when it loads the integration, then loads the
+entity descriptions of the given device categories. Reports the cumulative
+import time of the package and how long loading the categories took, taking
+the best of a number of runs. Run from the repository root:
+
+    python3 -m benchmarks.import_time --categories cam thermostat
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+PACKAGE = "custom_components.starling_home_hub"
+INTEGRATIONS = f"{PACKAGE}.integrations"
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Categories are loaded through importlib, which -X importtime does not report, so the script times them itself
+SCRIPT = f"""
+import json
+import sys
+import time
+import {PACKAGE}
+from {INTEGRATIONS} import load_device_categories
+modules = set(sys.modules)
+start = time.perf_counter()
+load_device_categories(sys.argv[1:])
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(set(sys.modules) - modules)}}))
+"""
+
+
+@dataclass
+class Run:
+    """The import times of one fresh interpreter."""
+
+    cumulative: dict[str, int]
+    category_elapsed: float
+    category_modules: list[str]
+
+
+def run_once(categories: list[str]) -> Run:
+    """Import the package and load the categories in a fresh interpreter, parsing each module's cumulative import time in µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT, *categories],
+        capture_output=True, text=True, check=True,
+    )
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if match := IMPORT_TIME_LINE.match(line):
+            cumulative[match.group(4)] = int(match.group(2))
+
+    loaded = json.loads(result.stdout.splitlines()[-1])
+    return Run(cumulative, loaded["elapsed"], loaded["modules"])
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    runs = [run_once(args.categories) for _ in range(args.repeat)]
+    best = {module: min(run.cumulative.get(module, 0) for run in runs) for module in runs[0].cumulative}
+
+    package_modules = sorted(
+        (module for module in best if module.startswith(PACKAGE)), key=best.get, reverse=True)
+    category_modules = [module for module in runs[0].category_modules if module.startswith(INTEGRATIONS + ".")]
+
+    imported = set(package_modules) | {module for module in runs[0].category_modules if module.startswith(PACKAGE)}
+    print(f"{PACKAGE}: {best[PACKAGE] / 1000:.1f}ms, {len(imported)} package modules imported")
+    print(f"categories {' '.join(args.categories) or '(none)'}: {len(category_modules)} modules, "
+          f"{min(run.category_elapsed for run in runs) * 1000:.1f}ms")
+
+    for module in package_modules[:args.top]:
+        print(f"  {best[module] / 1000:8.1f}ms  {module}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categories", nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    main(parser.parse_args())
@@ -0,0 +1,92 @@
+"""Benchmark a coordinator poll cycle against the mock server.
+
+Start the mock server with some injected latency and a larger house, e.g.:
+
+    MOCK_LATENCY=0.1 MOCK_DEVICE_COPIES=12 ./scripts/mockserver
+
+Then, from the repository root, time a cycle at different concurrency limits:
+
+    python3 -m benchmarks.poll_cycle --limits 1 4 8
+
+With N devices and a round trip of RTT, a cycle takes roughly N * RTT at a
+limit of 1 and N / limit * RTT above that.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import aiohttp
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_URL
+from homeassistant.core import HomeAssistant
+
+from custom_components.starling_home_hub.api import StarlingHomeHubApiClient
+from custom_components.starling_home_hub.const import DOMAIN
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
+
+
+def make_config_entry(url: str, api_key: str) -> ConfigEntry:
+    """Create a config entry that is never added to Home Assistant."""
+    return ConfigEntry(
+        data={CONF_URL: url, CONF_API_KEY: api_key},
+        discovery_keys={},
+        domain=DOMAIN,
+        minor_version=0,
+        options={},
+        source="user",
+        subentries_data=None,
+        title=url,
+        unique_id=None,
+        version=2,
+    )
+
+
+async def time_cycles(hass: HomeAssistant, session: aiohttp.ClientSession, args: argparse.Namespace, limit: int) -> list[float]:
+    """Time a number of poll cycles at the given concurrency limit."""
+    client = StarlingHomeHubApiClient(
+        url=args.url,
+        api_key=args.api_key,
+        session=session,
+        max_concurrent_requests=limit,
+    )
+    coordinator = StarlingHomeHubDataUpdateCoordinator(
+        hass=hass,
+        client=client,
+        config_entry=make_config_entry(args.url, args.api_key),
+    )
+
+    timings = []
+    for _ in range(args.cycles):
+        start = time.perf_counter()
+        data = await coordinator.fetch_data(poll_all=True)
+        timings.append(time.perf_counter() - start)
+
+    print(f"limit={limit:<3} devices={len(data.devices):<4} "
+          f"best={min(timings):.3f}s mean={sum(timings) / len(timings):.3f}s")
+
+    return timings
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        async with aiohttp.ClientSession() as session:
+            for limit in args.limits:
+                await time_cycles(hass, session, args, limit)
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:5000/")
+    parser.add_argument("--api-key", default="test")
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--limits", type=int, nargs="+", default=[1, 4, 8])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,172 @@
+"""Benchmark how many entity states are written per poll cycle.
+
+Builds a synthetic house of sensor devices, served by an in-memory hub, with
+around 500 sensor and binary sensor entities. Each cycle a share of the
+devices report a new temperature, and the benchmark counts how many entities
+are notified and how many actually write their state. Run from the
+repository root:
+
+    python3 -m benchmarks.state_writes --entities 500 --changed 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import tempfile
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_URL, Platform
+from homeassistant.core import HomeAssistant
+
+from custom_components.starling_home_hub.circuit_breaker import CircuitBreaker
+from custom_components.starling_home_hub.const import CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT, DOMAIN
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
+from custom_components.starling_home_hub.entities import StarlingHomeHubEntity
+from custom_components.starling_home_hub.entities.binary_sensor import StarlingHomeHubBinarySensorEntity
+from custom_components.starling_home_hub.entities.sensor import DATA_AGE_ENTITY_DESCRIPTION, StarlingHomeHubSensorEntity
+from custom_components.starling_home_hub.entity_plan import build_entity_plan
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.status import Status
+
+ENTITY_CLASSES = {
+    Platform.SENSOR: StarlingHomeHubSensorEntity,
+    Platform.BINARY_SENSOR: StarlingHomeHubBinarySensorEntity,
+}
+
+
+def make_device_properties(index: int) -> dict:
+    """Make the properties of a synthetic sensor device."""
+    return {
+        "type": "sensor",
+        "category": "sensor",
+        "id": f"sensor-{index}",
+        "name": f"Sensor {index}",
+        "model": "Synthetic Sensor",
+        "roomId": "room",
+        "roomName": "Room",
+        "structureId": "structure",
+        "structureName": "Home",
+        "serialNumber": str(index),
+        "isOnline": True,
+        "batteryLevel": 100,
+        "batteryStatus": "normal",
+        "currentTemperature": 20.0,
+        "humidityPercent": 50,
+        "motionDetected": False,
+        "contactState": "closed",
+    }
+
+
+class SyntheticHub:
+    """An in-memory hub that stands in for the API client."""
+
+    def __init__(self, device_count: int) -> None:
+        """Initialize."""
+        self.circuit_breaker = CircuitBreaker(CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT)
+        self.devices = {
+            properties["id"]: properties
+            for properties in map(make_device_properties, range(device_count))
+        }
+
+    async def async_get_devices(self) -> list[dict]:
+        """Get devices."""
+        return [{"id": device_id, "category": properties["category"]} for device_id, properties in self.devices.items()]
+
+    async def async_get_status(self) -> Status:
+        """Get status."""
+        return Status(apiVersion=2, apiReady=True, appName="benchmark", permissions={"read": True, "write": True, "camera": True})
+
+    async def async_get_device_if_changed(self, device_id: str, digest: str | None) -> tuple[str, Device | None]:
+        """Get a device, or None in its place if its payload still matches the digest."""
+        payload = json.dumps({"status": "OK", "properties": self.devices[device_id]}).encode()
+        payload_digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        if payload_digest == digest:
+            return payload_digest, None
+
+        return payload_digest, Device.create_from_dict(json.loads(payload))
+
+
+def make_entities(coordinator: StarlingHomeHubDataUpdateCoordinator) -> list[StarlingHomeHubEntity]:
+    """Create the entities the sensor and binary sensor platforms would."""
+    entity_plan = build_entity_plan(coordinator.data.devices)
+
+    return [
+        entity_class(device_id=device_id, coordinator=coordinator, entity_description=entity_description)
+        for platform, entity_class in ENTITY_CLASSES.items()
+        for device_id, entity_description in entity_plan.get(platform, [])
+        # Data age sensors are disabled unless asked for, so are not created
+        if entity_description is not DATA_AGE_ENTITY_DESCRIPTION
+    ]
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+
+        # Size the house from how many entities a single device creates
+        hub = SyntheticHub(1)
+        entry = ConfigEntry(
+            data={CONF_URL: "http://synthetic/", CONF_API_KEY: "benchmark"}, discovery_keys={}, domain=DOMAIN,
+            minor_version=0, options={}, source="user", subentries_data=None, title="benchmark", unique_id=None, version=2,
+        )
+        coordinator = StarlingHomeHubDataUpdateCoordinator(hass=hass, client=hub, config_entry=entry)
+        await coordinator.async_refresh()
+        entities_per_device = len(make_entities(coordinator))
+
+        hub = SyntheticHub(max(1, args.entities // entities_per_device))
+        coordinator = StarlingHomeHubDataUpdateCoordinator(hass=hass, client=hub, config_entry=entry)
+        await coordinator.async_refresh()
+        entities = make_entities(coordinator)
+
+        notified = 0
+        written = 0
+
+        def count_write() -> None:
+            nonlocal written
+            written += 1
+
+        def count_notify(entity: StarlingHomeHubEntity) -> None:
+            nonlocal notified
+            notified += 1
+            entity._handle_coordinator_update()
+
+        unsubs = []
+        for entity in entities:
+            entity.async_write_ha_state = count_write
+            unsubs.append(coordinator.async_add_listener(
+                lambda entity=entity: count_notify(entity)))
+
+        print(f"{len(hub.devices)} devices, {len(entities)} entities, "
+              f"{args.changed:.0%} of devices changing per cycle")
+
+        for cycle in range(1, args.cycles + 1):
+            for properties in random.sample(list(hub.devices.values()), round(len(hub.devices) * args.changed)):
+                properties["currentTemperature"] += 0.5
+
+            # Make every device due, as if the slowest polling interval had passed
+            coordinator._next_device_list_poll = 0
+            coordinator._next_device_poll.clear()
+
+            notified = written = 0
+            await coordinator.async_refresh()
+            print(f"cycle {cycle}: notified={notified:<4} state writes={written:<4} "
+                  f"(previously {len(entities)} writes per cycle)")
+
+        for unsub in unsubs:
+            unsub()
+
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--changed", type=float, default=0.05)
+    parser.add_argument("--cycles", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -6,14 +6,20 @@ https://github.com/ThomasLomas/ha-starlinghomehub
 
 from __future__ import annotations
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_API_KEY, CONF_URL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntry
 
 from custom_components.starling_home_hub.api import StarlingHomeHubApiClient
-from custom_components.starling_home_hub.const import CONF_ENABLE_RTSP_STREAM, CONF_ENABLE_WEBRTC_STREAM, CONF_RTSP_PASSWORD, CONF_RTSP_USERNAME, DOMAIN, LOGGER, PLATFORMS
-from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator, StarlingHomeHubConfigEntry
+from custom_components.starling_home_hub.const import (CONF_ENABLE_RTSP_STREAM, CONF_ENABLE_WEBRTC_STREAM, CONF_HEDGE_REQUESTS,
+                                                       CONF_MAX_CONCURRENT_REQUESTS, CONF_RTSP_PASSWORD, CONF_RTSP_USERNAME,
+                                                       DEFAULT_HEDGE_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS, DOMAIN, LOGGER, PLATFORMS)
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator, StarlingHomeHubConfigEntry, get_store
+from custom_components.starling_home_hub.entity_plan import build_entity_plan, get_platforms
+from custom_components.starling_home_hub.integrations import async_load_device_categories
+from custom_components.starling_home_hub.models.api.device import Device
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry) -> bool:
@@ -25,6 +31,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
         url=entry.data[CONF_URL],
         api_key=entry.data[CONF_API_KEY],
         session=async_get_clientsession(hass),
+        max_concurrent_requests=int(entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)),
+        hedge_requests=entry.options.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS),
     )
 
     hass.data.setdefault(DOMAIN, {})
@@ -34,14 +43,67 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
         config_entry=entry,
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if await coordinator.async_restore_data():
+        # Set the platforms up from the last saved data and let the hub catch up in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh")
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    # Only the platforms the hub's devices need are set up, others are loaded if a device needs them later
+    await async_load_device_categories(
+        hass, {device.properties["category"] for device in entry.runtime_data.devices.values()})
+    coordinator.entity_plan = build_entity_plan(entry.runtime_data.devices)
+    coordinator.platforms = get_platforms(coordinator.entity_plan)
+    coordinator.planned_devices = set(entry.runtime_data.devices)
+    LOGGER.debug(f"Setting up platforms: {', '.join(coordinator.platforms)}")
+
+    entry.async_on_unload(coordinator.async_add_listener(lambda: async_load_new_platforms(hass, entry)))
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
 
 
+@callback
+def async_load_new_platforms(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry) -> None:
+    """Load any platforms needed by devices the hub has gained since the platforms were set up."""
+    coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    devices = entry.runtime_data.devices
+
+    # Platforms can only be loaded once setup has finished, until then new devices are left for a later update
+    if entry.state is not ConfigEntryState.LOADED or devices.keys() <= coordinator.planned_devices:
+        return
+
+    new_devices = {device_id: device for device_id, device in devices.items() if device_id not in coordinator.planned_devices}
+    coordinator.planned_devices = set(devices)
+
+    entry.async_create_task(
+        hass, async_set_up_new_platforms(hass, entry, new_devices), f"{DOMAIN} set up new platforms")
+
+
+async def async_set_up_new_platforms(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry, new_devices: dict[str, Device]) -> None:
+    """Load the categories of new devices and set up any platforms they need that are not set up yet."""
+    coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    await async_load_device_categories(hass, {device.properties["category"] for device in new_devices.values()})
+    if entry.state is not ConfigEntryState.LOADED:
+        return
+
+    new_platforms = [
+        platform for platform in get_platforms(build_entity_plan(new_devices))
+        if platform not in coordinator.platforms
+    ]
+    if not new_platforms:
+        return
+
+    LOGGER.info(f"Setting up platforms for new devices: {', '.join(new_platforms)}")
+
+    coordinator.entity_plan = build_entity_plan(entry.runtime_data.devices)
+    coordinator.platforms = [platform for platform in PLATFORMS if platform in coordinator.platforms or platform in new_platforms]
+    await hass.config_entries.async_forward_entry_setups(entry, new_platforms)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry) -> None:
     """Reload config entry."""
 
@@ -55,7 +117,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEn
 
     LOGGER.info("Unloading Starling Home Hub integration")
 
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -63,6 +126,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEn
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry) -> None:
+    """Remove the saved data when a config entry is removed."""
+    await get_store(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant, config_entry: StarlingHomeHubConfigEntry, device_entry: DeviceEntry
 ) -> bool:
@@ -72,7 +140,7 @@ async def async_remove_config_entry_device(
 
     starling_device_id = list(device_entry.identifiers)[0][1]
 
-    if starling_device_id in config_entry.runtime_data.devices:
+    if starling_device_id in config_entry.runtime_data.devices or starling_device_id == config_entry.entry_id:
         LOGGER.warning(f"Not removing device {
                        starling_device_id} - still in use")
         return False
@@ -3,17 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import random
 import socket
+import time
 
 import aiohttp
 import async_timeout
 from homeassistant.exceptions import HomeAssistantError
-
-from custom_components.starling_home_hub.const import LOGGER
+from homeassistant.util.json import json_loads
+
+from custom_components.starling_home_hub.circuit_breaker import CircuitBreaker, CircuitState
+from custom_components.starling_home_hub.const import (CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT,
+                                                       DEFAULT_HEDGE_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS, HEDGE_BUDGET_MAX,
+                                                       HEDGE_BUDGET_RATIO, GET_RETRY_ATTEMPTS, GET_RETRY_BACKOFF,
+                                                       GET_RETRY_MAX_BACKOFF, LOGGER, REQUEST_BURST, REQUEST_RATE, REQUEST_TIMEOUT_CEILING, REQUEST_TIMEOUT_FLOOR,
+                                                       REQUEST_TIMEOUT_MIN_SAMPLES, REQUEST_TIMEOUT_MULTIPLIER)
+from custom_components.starling_home_hub.latency import LatencyTracker
 from custom_components.starling_home_hub.models.api.device import Device, DeviceUpdate
 from custom_components.starling_home_hub.models.api.devices import Devices
 from custom_components.starling_home_hub.models.api.status import Status
 from custom_components.starling_home_hub.models.api.stream import StartStream, StreamStatus
+from custom_components.starling_home_hub.request_scheduler import RequestPriority, RequestScheduler
 
 
 class StarlingHomeHubApiClientError(Exception):
@@ -26,6 +37,12 @@ class StarlingHomeHubApiClientCommunicationError(
     """Exception to indicate a communication error."""
 
 
+class StarlingHomeHubApiClientCircuitOpenError(
+    StarlingHomeHubApiClientCommunicationError
+):
+    """Exception to indicate the circuit breaker rejected a request without sending it."""
+
+
 class StarlingHomeHubApiClientAuthenticationError(
     StarlingHomeHubApiClientError
 ):
@@ -40,16 +57,34 @@ class StarlingHomeHubApiClient:
         url: str,
         api_key: str,
         session: aiohttp.ClientSession,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        hedge_requests: bool = DEFAULT_HEDGE_REQUESTS,
     ) -> None:
         """Starling Home Hub Developer Connect API Client."""
         self._url = url
         self._api_key = api_key
         self._session = session
+        # Bounds how many requests can be in flight against the hub at once, and lets user actions go first
+        self.scheduler = RequestScheduler(
+            max_concurrent_requests, REQUEST_RATE, REQUEST_BURST)
+        self.circuit_breaker = CircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT)
+        self.latency = LatencyTracker(
+            REQUEST_TIMEOUT_MULTIPLIER, REQUEST_TIMEOUT_FLOOR, REQUEST_TIMEOUT_CEILING, REQUEST_TIMEOUT_MIN_SAMPLES)
+        self._hedge_requests = hedge_requests
+        self._hedge_budget: float = HEDGE_BUDGET_MAX
+        self.hedged_requests = 0
+        self.hedge_wins = 0
 
     def get_api_url_for_endpoint(self, endpoint: str) -> str:
         """Build URL for the API."""
         return self._url + endpoint + "?key=" + self._api_key
 
+    def get_endpoint_for_api_url(self, method: str, url: str) -> str:
+        """Name the endpoint of a URL for the API, with the device and stream ids left out."""
+        parts = url.removeprefix(self._url).split("?")[0].split("/")
+        return method.upper() + " " + "/".join("{id}" if i in (1, 3) else part for i, part in enumerate(parts))
+
     async def async_get_status(self) -> Status:
         """Get status from the API."""
         status_response = await self._api_wrapper(
@@ -58,15 +93,29 @@ class StarlingHomeHubApiClient:
 
         return Status.create_from_dict(status_response)
 
-    async def async_get_device(self, device_id: str) -> Device:
-        """Get devices from the API."""
-        device_response = await self._api_wrapper(
-            method="get", url=self.get_api_url_for_endpoint(f"devices/{device_id}")
+    async def async_get_device_if_changed(
+        self, device_id: str, digest: str | None, priority: RequestPriority = RequestPriority.POLL
+    ) -> tuple[str, Device | None]:
+        """Get a device from the API, only parsing it if its payload no longer matches the digest.
+
+        Returns the digest of the payload along with the device, or None in place of the device if it is unchanged.
+        """
+        device_payload: bytes = await self._api_wrapper(
+            method="get", url=self.get_api_url_for_endpoint(f"devices/{device_id}"), as_json=False, priority=priority
         )
 
-        return Device(**device_response)
+        payload_digest = hashlib.blake2b(device_payload, digest_size=16).hexdigest()
+        if payload_digest == digest:
+            return payload_digest, None
 
-    async def async_update_device(self, device_id: str, update: dict) -> DeviceUpdate:
+        try:
+            return payload_digest, Device.create_from_dict(json_loads(device_payload))
+        except Exception as exception:  # pylint: disable=broad-except
+            raise StarlingHomeHubApiClientError(
+                f"Invalid response for device {device_id}"
+            ) from exception
+
+    async def async_update_device(self, device_id: str, update: dict, raise_on_error: bool = True) -> DeviceUpdate:
         """Update a device."""
         LOGGER.debug(f"Updating device {device_id} with {update}")
 
@@ -74,13 +123,22 @@ class StarlingHomeHubApiClient:
             method="post",
             url=self.get_api_url_for_endpoint(f"devices/{device_id}"),
             data=update,
-            headers={"Content-type": "application/json; charset=UTF-8"}
+            headers={"Content-type": "application/json; charset=UTF-8"},
+            priority=RequestPriority.USER,
         )
 
         LOGGER.debug(f"Response from update: {update_response}")
 
         device_update = DeviceUpdate(**update_response)
 
+        if raise_on_error:
+            self.raise_for_set_status(device_update)
+
+        return device_update
+
+    @staticmethod
+    def raise_for_set_status(device_update: DeviceUpdate) -> None:
+        """Raise if the hub failed to set any of the properties in a device update."""
         if device_update.setStatus:
             # Loop all the set status results and check if any errors
             for key, value in device_update.setStatus.items():
@@ -97,8 +155,6 @@ class StarlingHomeHubApiClient:
                     raise HomeAssistantError(
                         f"Error setting {key}: Failed - the Google Home service reported an error trying to set the property")
 
-        return device_update
-
     async def async_get_devices(self) -> list[Device]:
         """Get devices from the API."""
         devices_response = await self._api_wrapper(
@@ -116,7 +172,8 @@ class StarlingHomeHubApiClient:
             method="post",
             url=self.get_api_url_for_endpoint(f"devices/{device_id}/stream"),
             data={"offer": sdp_offer},
-            headers={"Content-type": "application/json; charset=UTF-8"}
+            headers={"Content-type": "application/json; charset=UTF-8"},
+            priority=RequestPriority.USER,
         )
 
         return StartStream(**start_stream_response)
@@ -128,7 +185,8 @@ class StarlingHomeHubApiClient:
             url=self.get_api_url_for_endpoint(
                 f"devices/{device_id}/stream/{stream_id}/stop"),
             headers={"Content-type": "application/json; charset=UTF-8"},
-            data={}
+            data={},
+            priority=RequestPriority.USER,
         )
 
         return StreamStatus(**stop_stream_response)
@@ -139,7 +197,8 @@ class StarlingHomeHubApiClient:
             method="get",
             url=self.get_api_url_for_endpoint(
                 f"devices/{device_id}/snapshot"),
-            as_json=False
+            as_json=False,
+            priority=RequestPriority.SNAPSHOT,
         )
 
     async def async_extend_stream(self, device_id: str, stream_id: str) -> StreamStatus:
@@ -149,7 +208,8 @@ class StarlingHomeHubApiClient:
             url=self.get_api_url_for_endpoint(
                 f"devices/{device_id}/stream/{stream_id}/extend"),
             headers={"Content-type": "application/json; charset=UTF-8"},
-            data={}
+            data={},
+            priority=RequestPriority.USER,
         )
 
         return StreamStatus(**extend_stream_response)
@@ -161,34 +221,168 @@ class StarlingHomeHubApiClient:
         data: dict | None = None,
         headers: dict | None = None,
         as_json: bool = True,
+        priority: RequestPriority = RequestPriority.POLL,
+    ) -> any:
+        """Get information from the API, retrying GETs with jittered exponential backoff."""
+        attempts = GET_RETRY_ATTEMPTS + 1 if method == "get" else 1
+
+        for attempt in range(attempts):
+            try:
+                if method == "get" and self._hedge_requests:
+                    return await self._hedged_api_request(method, url, data, headers, as_json, priority)
+                return await self._api_request(method, url, data, headers, as_json, priority)
+            except StarlingHomeHubApiClientCommunicationError as exception:
+                if (
+                    attempt == attempts - 1
+                    or not _is_transient_error(exception)
+                    or self.circuit_breaker.state != CircuitState.CLOSED
+                ):
+                    raise
+
+                backoff = random.uniform(0, min(GET_RETRY_MAX_BACKOFF, GET_RETRY_BACKOFF * 2 ** attempt))
+                LOGGER.debug(f"Request failed, retrying in {backoff:.2f}s: {exception}")
+                await asyncio.sleep(backoff)
+
+    async def _hedged_api_request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        as_json: bool,
+        priority: RequestPriority,
     ) -> any:
-        """Get information from the API."""
+        """Make a request, sending a second identical one if the first is in flight for longer than its endpoint's p95.
+
+        Whichever answers first is used and the other is cancelled. Every request earns a fraction of
+        a hedge, so hedging cannot add more than that fraction of load when the hub is slow across the board.
+        Time spent waiting for a slot does not count, and no hedge is sent while other requests are waiting for one.
+        """
+        self._hedge_budget = min(HEDGE_BUDGET_MAX, self._hedge_budget + HEDGE_BUDGET_RATIO)
+
+        if (hedge_delay := self.latency.p95(self.get_endpoint_for_api_url(method, url))) is None:
+            return await self._api_request(method, url, data, headers, as_json, priority)
+
+        in_flight = asyncio.Event()
+        tasks = {asyncio.create_task(self._api_request(method, url, data, headers, as_json, priority, in_flight))}
+        in_flight_waiter = asyncio.create_task(in_flight.wait())
+        first_exception: BaseException | None = None
+
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                )
-                if response.status in (401, 403):
-                    raise StarlingHomeHubApiClientAuthenticationError(
-                        "Invalid credentials",
+            await asyncio.wait({*tasks, in_flight_waiter}, return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+
+            if (
+                not done
+                and self._hedge_budget >= 1
+                and self.circuit_breaker.state == CircuitState.CLOSED
+                and self.scheduler.has_free_slot()
+            ):
+                LOGGER.debug(f"Request slower than {hedge_delay:.2f}s, hedging it")
+                self._hedge_budget -= 1
+                self.hedged_requests += 1
+                hedge = asyncio.create_task(self._api_request(method, url, data, headers, as_json, priority))
+                tasks.add(hedge)
+            else:
+                hedge = None
+
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (exception := task.exception()) is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+                    first_exception = first_exception or exception
+
+            raise first_exception
+        finally:
+            in_flight_waiter.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def _api_request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        as_json: bool,
+        priority: RequestPriority,
+        in_flight: asyncio.Event | None = None,
+    ) -> any:
+        """Make a single request to the API, failing fast while the circuit breaker is open.
+
+        The in flight event is set once the request has its slot and is sent to the hub.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise StarlingHomeHubApiClientCircuitOpenError(
+                "Hub is not responding, waiting before trying again",
+            )
+
+        endpoint = self.get_endpoint_for_api_url(method, url)
+
+        try:
+            async with self.scheduler.slot(priority):
+                if in_flight is not None:
+                    in_flight.set()
+                timeout = self.latency.timeout(endpoint)
+                started = time.monotonic()
+                async with async_timeout.timeout(timeout):
+                    response = await self._session.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        json=data,
                     )
-                response.raise_for_status()
-                return await response.json() if as_json else await response.read()
+                    if response.status in (401, 403):
+                        raise StarlingHomeHubApiClientAuthenticationError(
+                            "Invalid credentials",
+                        )
+                    response.raise_for_status()
+                    result = await response.json() if as_json else await response.read()
+                    self.latency.add(endpoint, time.monotonic() - started)
 
         except asyncio.TimeoutError as exception:
+            # Counted at the timeout, so an endpoint that keeps timing out has its timeout raised
+            self.latency.add(endpoint, timeout)
+            self.circuit_breaker.record_failure()
+            raise StarlingHomeHubApiClientCommunicationError(
+                f"Timeout error fetching information after {timeout:.1f}s",
+            ) from exception
+        except aiohttp.ClientResponseError as exception:
+            if exception.status >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
             raise StarlingHomeHubApiClientCommunicationError(
-                "Timeout error fetching information",
+                "Error fetching information",
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            self.circuit_breaker.record_failure()
             raise StarlingHomeHubApiClientCommunicationError(
                 "Error fetching information",
             ) from exception
         except StarlingHomeHubApiClientAuthenticationError as exception:
+            self.circuit_breaker.record_success()
             raise exception
+        except asyncio.CancelledError:
+            self.circuit_breaker.release_request()
+            raise
         except Exception as exception:  # pylint: disable=broad-except
+            self.circuit_breaker.release_request()
             raise StarlingHomeHubApiClientError(
                 "Something really wrong happened!"
             ) from exception
+
+        self.circuit_breaker.record_success()
+        return result
+
+
+def _is_transient_error(exception: StarlingHomeHubApiClientCommunicationError) -> bool:
+    """Return whether a failed request may succeed if it is retried."""
+    if isinstance(exception, StarlingHomeHubApiClientCircuitOpenError):
+        return False
+
+    cause = exception.__cause__
+    return not isinstance(cause, aiohttp.ClientResponseError) or cause.status >= 500
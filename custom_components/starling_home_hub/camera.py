@@ -1,5 +1,6 @@
 """Camera platform for Starling Home Hub."""
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -19,18 +20,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
     enable_rtsp_stream = entry.data.get("enable_rtsp_stream", False)
     enable_webrtc_stream = entry.data.get("enable_webrtc_stream", False)
 
-    for device in filter(lambda device: device[1].properties["category"] == "cam", entry.runtime_data.devices.items()):
-        if enable_webrtc_stream and "supportsWebRtcStreaming" in device[1].properties and device[1].properties["supportsWebRtcStreaming"]:
+    for device_id, _ in coordinator.entity_plan.get(Platform.CAMERA, []):
+        properties = entry.runtime_data.devices[device_id].properties
+        if enable_webrtc_stream and properties.supportsWebRtcStreaming:
             entities.append(
                 StarlingHomeHubWebRTCCamera(
-                    device_id=device[0],
+                    device_id=device_id,
                     coordinator=coordinator
                 )
             )
-        elif enable_rtsp_stream and "rtspStreamingEnabled" in device[1].properties and device[1].properties["rtspStreamingEnabled"]:
+        elif enable_rtsp_stream and properties.rtspStreamingEnabled:
             entities.append(
                 StarlingHomeHubRTSPCamera(
-                    device_id=device[0],
+                    device_id=device_id,
                     coordinator=coordinator,
                     rtsp_username=entry.data.get("rtsp_username", None),
                     rtsp_password=entry.data.get("rtsp_password", None)
@@ -0,0 +1,87 @@
+"""Circuit breaker for requests to the Starling Home Hub."""
+
+from __future__ import annotations
+
+import time
+from enum import StrEnum
+
+from custom_components.starling_home_hub.const import LOGGER
+
+
+class CircuitState(StrEnum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops requests to a hub that keeps failing, so they fail fast instead of waiting out their timeouts.
+
+    After enough consecutive failures the breaker opens. Once the reset timeout has passed a
+    single trial request is let through, closing the breaker if it succeeds or opening it again if not.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at: float = 0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the breaker, half open once the reset timeout has passed."""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            return CircuitState.HALF_OPEN
+
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Return how many requests have failed in a row."""
+        return self._failures
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be made, claiming the trial request if the breaker is half open."""
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = True
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Record that the hub answered a request."""
+        if self._state != CircuitState.CLOSED:
+            LOGGER.info("Hub is responding again, closing circuit breaker")
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def release_request(self) -> None:
+        """Record that a request was abandoned before the hub answered, freeing the trial request."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record that a request to the hub failed."""
+        self._failures += 1
+        self._trial_in_flight = False
+
+        if self._state == CircuitState.HALF_OPEN or (
+            self._state == CircuitState.CLOSED and self._failures >= self._failure_threshold
+        ):
+            if self._state == CircuitState.CLOSED:
+                LOGGER.warning(f"Hub failed {self._failures} requests in a row, opening circuit breaker")
+
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
@@ -1,25 +1,39 @@
-"""Adds config flow for Staring Home Hub used in initial setup."""
+"""Adds config flow for Starling Home Hub used in initial setup."""
 
 from __future__ import annotations
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow, FlowResult
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, FlowResult, OptionsFlow
 from homeassistant.const import CONF_API_KEY, CONF_URL
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from custom_components.starling_home_hub.api import (StarlingHomeHubApiClient, StarlingHomeHubApiClientAuthenticationError,
                                                      StarlingHomeHubApiClientCommunicationError, StarlingHomeHubApiClientError)
-from custom_components.starling_home_hub.const import (CONF_ENABLE_RTSP_STREAM, CONF_ENABLE_WEBRTC_STREAM, CONF_RTSP_PASSWORD,
-                                                       CONF_RTSP_USERNAME, DOMAIN, LOGGER)
+from custom_components.starling_home_hub.const import (CONF_ENABLE_RTSP_STREAM, CONF_ENABLE_WEBRTC_STREAM, CONF_FAST_POLL_CATEGORIES,
+                                                       CONF_HEDGE_REQUESTS, CONF_MAX_CONCURRENT_REQUESTS, CONF_OPTIMISTIC_TIMEOUT,
+                                                       CONF_PREFETCH_SNAPSHOTS, CONF_PREWARM_GRACE_PERIOD, CONF_PREWARM_STREAMS,
+                                                       CONF_RTSP_PASSWORD, CONF_RTSP_USERNAME, CONF_SLOW_POLL_CATEGORIES,
+                                                       CONF_STALE_THRESHOLD, DEFAULT_FAST_POLL_CATEGORIES, DEFAULT_HEDGE_REQUESTS,
+                                                       DEFAULT_MAX_CONCURRENT_REQUESTS, DEFAULT_OPTIMISTIC_TIMEOUT,
+                                                       DEFAULT_PREFETCH_SNAPSHOTS, DEFAULT_PREWARM_GRACE_PERIOD, DEFAULT_PREWARM_STREAMS,
+                                                       DEFAULT_SLOW_POLL_CATEGORIES, DEFAULT_STALE_THRESHOLD, DOMAIN, LOGGER)
+from custom_components.starling_home_hub.integrations import DEVICE_CATEGORY_MODULES
 
 
 class StarlingHomeHubFlowHandler(ConfigFlow, domain=DOMAIN):
-    """Config flow for Staring Home Hub."""
+    """Config flow for Starling Home Hub."""
 
     VERSION = 2
     MINOR_VERSION = 0
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return StarlingHomeHubOptionsFlowHandler()
+
     def create_schema(self, user_input: dict | None = None) -> vol.Schema:
         """Create schema."""
 
@@ -136,3 +150,90 @@ class StarlingHomeHubFlowHandler(ConfigFlow, domain=DOMAIN):
             raise StarlingHomeHubApiClientAuthenticationError(
                 "API Key does not have read permissions",
             )
+
+
+class StarlingHomeHubOptionsFlowHandler(OptionsFlow):
+    """Options flow for tuning how Starling Home Hub talks to the hub."""
+
+    def create_categories_selector(self) -> selector.SelectSelector:
+        """Create a selector for picking device categories."""
+
+        return selector.SelectSelector(
+            selector.SelectSelectorConfig(
+                options=list(DEVICE_CATEGORY_MODULES),
+                multiple=True,
+                mode=selector.SelectSelectorMode.DROPDOWN,
+            ),
+        )
+
+    def create_schema(self) -> vol.Schema:
+        """Create schema."""
+
+        return vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1, max=16, step=1, mode=selector.NumberSelectorMode.BOX
+                    ),
+                ),
+                vol.Optional(
+                    CONF_HEDGE_REQUESTS,
+                    default=DEFAULT_HEDGE_REQUESTS,
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_OPTIMISTIC_TIMEOUT,
+                    default=DEFAULT_OPTIMISTIC_TIMEOUT,
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0, max=300, step=1, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX
+                    ),
+                ),
+                vol.Optional(
+                    CONF_STALE_THRESHOLD,
+                    default=DEFAULT_STALE_THRESHOLD,
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=10, max=3600, step=1, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX
+                    ),
+                ),
+                vol.Optional(
+                    CONF_FAST_POLL_CATEGORIES,
+                    default=DEFAULT_FAST_POLL_CATEGORIES,
+                ): self.create_categories_selector(),
+                vol.Optional(
+                    CONF_SLOW_POLL_CATEGORIES,
+                    default=DEFAULT_SLOW_POLL_CATEGORIES,
+                ): self.create_categories_selector(),
+                vol.Optional(
+                    CONF_PREFETCH_SNAPSHOTS,
+                    default=DEFAULT_PREFETCH_SNAPSHOTS,
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_PREWARM_STREAMS,
+                    default=DEFAULT_PREWARM_STREAMS,
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_PREWARM_GRACE_PERIOD,
+                    default=DEFAULT_PREWARM_GRACE_PERIOD,
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=5, max=300, step=1, unit_of_measurement="s", mode=selector.NumberSelectorMode.BOX
+                    ),
+                ),
+            }
+        )
+
+    async def async_step_init(self, user_input: dict | None = None) -> FlowResult:
+        """Manage the options."""
+
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                self.create_schema(), self.config_entry.options),
+        )
@@ -1,5 +1,6 @@
 """All constants used globally across the integration."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 from homeassistant.const import Platform
@@ -15,6 +16,96 @@ CONF_ENABLE_RTSP_STREAM = "enable_rtsp_stream"
 CONF_ENABLE_WEBRTC_STREAM = "enable_webrtc_stream"
 CONF_RTSP_USERNAME = "rtsp_username"
 CONF_RTSP_PASSWORD = "rtsp_password"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_OPTIMISTIC_TIMEOUT = "optimistic_timeout"
+CONF_FAST_POLL_CATEGORIES = "fast_poll_categories"
+CONF_SLOW_POLL_CATEGORIES = "slow_poll_categories"
+CONF_PREFETCH_SNAPSHOTS = "prefetch_snapshots"
+CONF_PREWARM_STREAMS = "prewarm_streams"
+CONF_PREWARM_GRACE_PERIOD = "prewarm_grace_period"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_STALE_THRESHOLD = "stale_threshold"
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_OPTIMISTIC_TIMEOUT = 30
+DEFAULT_FAST_POLL_CATEGORIES = ["cam", "smoke_co_detector"]
+DEFAULT_SLOW_POLL_CATEGORIES = ["diffuser", "heater_cooler", "humidifier_dehumidifier", "kettle", "purifier", "thermostat"]
+DEFAULT_PREFETCH_SNAPSHOTS = False
+DEFAULT_PREWARM_STREAMS = False
+DEFAULT_PREWARM_GRACE_PERIOD = 30
+DEFAULT_HEDGE_REQUESTS = False
+# Devices keep their last known state while the hub or the device fails, becoming unavailable once not fetched for this many seconds
+DEFAULT_STALE_THRESHOLD = 180
+
+# Devices are polled on one of these tiers by category, everything else is on the normal tier.
+# The device list and hub status are always refreshed on the normal tier.
+FAST_POLL_INTERVAL = timedelta(seconds=2)
+NORMAL_POLL_INTERVAL = timedelta(seconds=10)
+SLOW_POLL_INTERVAL = timedelta(seconds=60)
+
+# While a lock, garage door or valve is moving it is polled on its own, starting at this
+# interval and backing off, until it reaches its target state or the timeout passes
+TRANSITION_POLL_INTERVAL = 0.5
+TRANSITION_POLL_MAX_INTERVAL = 4
+TRANSITION_POLL_BACKOFF = 1.5
+TRANSITION_TIMEOUT = 60
+
+# The last good data for each hub is saved at most this often, so entities can be set up at startup before the hub answers
+STORAGE_VERSION = 1
+STORAGE_SAVE_INTERVAL = 60
+
+# Camera snapshots are served from a cache bounded to this many bytes per hub. Once a snapshot
+# is older than its TTL the cached one is still served while a new one is fetched.
+SNAPSHOT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+SNAPSHOT_TTL = 10
+SNAPSHOT_BATTERY_TTL = 60
+
+# When snapshot prefetching is enabled, a camera's snapshot is fetched as soon as a poll sees one of these turn on
+SNAPSHOT_PREFETCH_PROPERTIES = ["motionDetected", "personDetected", "doorbellPushed"]
+
+# When stream pre-warming is enabled, an RTSP camera's stream is started as soon as a poll sees one of these turn on
+STREAM_PREWARM_PROPERTIES = frozenset({"doorbellPushed", "personDetected"})
+
+# Each WebRTC session gets its own stream from the hub, at most this many at once per hub
+MAX_CONCURRENT_STREAMS = 4
+
+# Streams are extended this many seconds before they expire. Extensions falling due within the
+# batch window of each other are sent together, and failed ones are retried with backoff until the stream expires.
+STREAM_LIFETIME = 90
+STREAM_EXTEND_LEAD = 30
+STREAM_EXTEND_BATCH_WINDOW = 5
+STREAM_EXTEND_RETRY_INTERVAL = 1
+STREAM_EXTEND_RETRY_MAX_INTERVAL = 8
+
+# Requests to each hub are limited to this many per second on average, in bursts of up to this many
+REQUEST_RATE = 20
+REQUEST_BURST = 20
+
+# After this many requests fail in a row, requests to the hub fail fast until the reset timeout passes
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+# Requests time out at their endpoint's p99 latency times the multiplier, kept between the floor and ceiling.
+# Endpoints with fewer samples than the minimum use the ceiling and are not hedged, as the p99 and p95
+# estimates take a couple of hundred samples to settle on a slow tail.
+REQUEST_TIMEOUT_MULTIPLIER = 3
+REQUEST_TIMEOUT_FLOOR = 1
+REQUEST_TIMEOUT_CEILING = 10
+REQUEST_TIMEOUT_MIN_SAMPLES = 200
+
+# When hedging is enabled, a GET slower than its endpoint's p95 is sent again. Each GET earns this
+# fraction of a hedge, and at most this many unused hedges are kept.
+HEDGE_BUDGET_RATIO = 0.1
+HEDGE_BUDGET_MAX = 10
+
+# Failed GETs are retried this many times, waiting a random time up to an exponentially growing limit
+GET_RETRY_ATTEMPTS = 2
+GET_RETRY_BACKOFF = 0.5
+GET_RETRY_MAX_BACKOFF = 4
+
+# Writes to the same device that arrive within this many seconds are sent as one
+WRITE_COALESCE_WINDOW = 0.1
+MAX_CONCURRENT_WRITES = 2
 
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -2,23 +2,83 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Iterable
+from functools import partial
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from custom_components.starling_home_hub.api import (StarlingHomeHubApiClient, StarlingHomeHubApiClientAuthenticationError,
-                                                     StarlingHomeHubApiClientError)
-from custom_components.starling_home_hub.const import DOMAIN, LOGGER
+                                                     StarlingHomeHubApiClientCommunicationError, StarlingHomeHubApiClientError)
+from custom_components.starling_home_hub.circuit_breaker import CircuitState
+from custom_components.starling_home_hub.const import (CONF_FAST_POLL_CATEGORIES, CONF_OPTIMISTIC_TIMEOUT, CONF_PREFETCH_SNAPSHOTS,
+                                                       CONF_PREWARM_GRACE_PERIOD, CONF_PREWARM_STREAMS, CONF_SLOW_POLL_CATEGORIES,
+                                                       CONF_STALE_THRESHOLD, DEFAULT_FAST_POLL_CATEGORIES, DEFAULT_OPTIMISTIC_TIMEOUT,
+                                                       DEFAULT_PREFETCH_SNAPSHOTS, DEFAULT_PREWARM_GRACE_PERIOD, DEFAULT_PREWARM_STREAMS,
+                                                       DEFAULT_SLOW_POLL_CATEGORIES, DEFAULT_STALE_THRESHOLD, DOMAIN, FAST_POLL_INTERVAL,
+                                                       LOGGER, MAX_CONCURRENT_STREAMS, MAX_CONCURRENT_WRITES, NORMAL_POLL_INTERVAL,
+                                                       SLOW_POLL_INTERVAL, SNAPSHOT_BATTERY_TTL, SNAPSHOT_CACHE_MAX_BYTES,
+                                                       SNAPSHOT_PREFETCH_PROPERTIES, SNAPSHOT_TTL, STORAGE_SAVE_INTERVAL, STORAGE_VERSION,
+                                                       TRANSITION_POLL_BACKOFF, TRANSITION_POLL_INTERVAL, TRANSITION_POLL_MAX_INTERVAL,
+                                                       TRANSITION_TIMEOUT, WRITE_COALESCE_WINDOW)
 from custom_components.starling_home_hub.models.api.device import Device, DeviceUpdate
-from custom_components.starling_home_hub.models.api.stream import StartStream, StreamStatus
-from custom_components.starling_home_hub.models.coordinator import CoordinatorData
+from custom_components.starling_home_hub.models.api.status import Status
+from custom_components.starling_home_hub.models.coordinator import CoordinatorData, EntityPlan, OptimisticUpdate, PendingWrite
+from custom_components.starling_home_hub.request_scheduler import RequestPriority
+from custom_components.starling_home_hub.snapshot_cache import SnapshotCache
+from custom_components.starling_home_hub.stream_sessions import StreamSessionManager
 
 type StarlingHomeHubConfigEntry = ConfigEntry[CoordinatorData]
 
 
+def get_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Get the store that holds the last good data for a hub."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+# Added to a device's changes when it becomes stale or fresh again, so all of its entities write their availability
+AVAILABILITY_CHANGED = "__availability__"
+
+
+def diff_devices(
+    previous_devices: dict[str, Device], devices: dict[str, Device], device_ids: Iterable[str] | None = None
+) -> dict[str, set[str]]:
+    """Work out which properties changed on each device, leaving out devices that did not change.
+
+    Only the given devices are compared if any are given, as every other device is known to be unchanged.
+    """
+    device_changes: dict[str, set[str]] = {}
+
+    for device_id in previous_devices.keys() | devices.keys() if device_ids is None else device_ids:
+        previous_device = previous_devices.get(device_id)
+        device = devices.get(device_id)
+
+        if previous_device is device:
+            continue
+
+        previous_properties = previous_device.properties if previous_device else {}
+        properties = device.properties if device else {}
+
+        if previous_properties == properties:
+            continue
+
+        device_changes[device_id] = {
+            key for key in previous_properties.keys() | properties.keys()
+            if key not in previous_properties or key not in properties or previous_properties[key] != properties[key]
+        }
+
+    return device_changes
+
+
 class StarlingHomeHubDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -35,74 +95,601 @@ class StarlingHomeHubDataUpdateCoordinator(DataUpdateCoordinator):
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            # Ticks at the fastest polling tier, each tick only fetches the devices that are due
+            update_interval=FAST_POLL_INTERVAL,
             config_entry=config_entry,
+            always_update=False,
         )
         self.client = client
+        self.fast_poll_categories: list[str] = config_entry.options.get(
+            CONF_FAST_POLL_CATEGORIES, DEFAULT_FAST_POLL_CATEGORIES)
+        self.slow_poll_categories: list[str] = config_entry.options.get(
+            CONF_SLOW_POLL_CATEGORIES, DEFAULT_SLOW_POLL_CATEGORIES)
+        self._device_categories: dict[str, str] = {}
+        self._next_device_poll: dict[str, float] = {}
+        self._next_device_list_poll: float = 0
+        # Whether the last update failed because the hub itself did not answer, rather than a device on its own
+        self._hub_failing = False
+        # Each device's last payload digest and the device parsed from it, an unchanged payload reuses that device
+        # as is, so it is never changed in place
+        self._parsed_devices: dict[str, tuple[str, Device]] = {}
+        self._transition_tasks: dict[str, asyncio.Task] = {}
+        self._stale_devices: set[str] = set()
+        self._unsub_stale_check: CALLBACK_TYPE | None = None
+        self.stale_threshold = timedelta(seconds=config_entry.options.get(
+            CONF_STALE_THRESHOLD, DEFAULT_STALE_THRESHOLD))
+        # The properties that changed on each device in the latest update, None if every entity should write its state
+        self.device_changes: dict[str, set[str]] | None = None
+        self._store = get_store(hass, config_entry.entry_id)
+        self._next_store_save: float = 0
+        self.optimistic_timeout: float = config_entry.options.get(
+            CONF_OPTIMISTIC_TIMEOUT, DEFAULT_OPTIMISTIC_TIMEOUT)
+        self._optimistic_updates: dict[str, dict[str, OptimisticUpdate]] = {}
+        self._pending_writes: dict[str, list[PendingWrite]] = {}
+        self._device_write_locks: dict[str, asyncio.Lock] = {}
+        self._write_semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+        # Lives on the coordinator rather than in the data, which is replaced on every poll
+        self.snapshot_cache = SnapshotCache(
+            hass, config_entry, lambda device_id: client.async_get_camera_snapshot(device_id=device_id), SNAPSHOT_CACHE_MAX_BYTES)
+        self.stream_sessions = StreamSessionManager(
+            hass, config_entry, client, MAX_CONCURRENT_STREAMS)
+        self.prefetch_snapshots: bool = config_entry.options.get(
+            CONF_PREFETCH_SNAPSHOTS, DEFAULT_PREFETCH_SNAPSHOTS)
+        self.prewarm_streams: bool = config_entry.options.get(
+            CONF_PREWARM_STREAMS, DEFAULT_PREWARM_STREAMS)
+        self.prewarm_grace_period: int = int(config_entry.options.get(
+            CONF_PREWARM_GRACE_PERIOD, DEFAULT_PREWARM_GRACE_PERIOD))
+        # Built once the devices are known, before the platforms are set up
+        self.entity_plan: EntityPlan = {}
+        # The platforms set up for this hub and the devices they were planned from
+        self.platforms: list[Platform] = []
+        self.planned_devices: set[str] = set()
 
-    async def start_stream(self, device_id: str, sdp_offer: str) -> StartStream:
-        """Start a stream."""
-        return await self.client.async_start_stream(device_id=device_id, sdp_offer=sdp_offer)
+    async def update_device(self, device_id: str, update: dict) -> DeviceUpdate:
+        """Update a device.
 
-    async def stop_stream(self, device_id: str, stream_id: str) -> StreamStatus:
-        """Stop a stream."""
-        return await self.client.async_stop_stream(device_id=device_id, stream_id=stream_id)
+        Updates to the same device that arrive within a short window are merged into a single
+        request, with later values winning. Each caller still gets the set status of its own properties.
+        """
+        future: asyncio.Future[DeviceUpdate] = self.hass.loop.create_future()
+        pending_writes = self._pending_writes.setdefault(device_id, [])
+        pending_writes.append(PendingWrite(update=update, future=future))
 
-    async def extend_stream(self, device_id: str, stream_id: str) -> StreamStatus:
-        """Extend a stream."""
-        return await self.client.async_extend_stream(device_id=device_id, stream_id=stream_id)
+        if len(pending_writes) == 1:
+            self.config_entry.async_create_background_task(
+                self.hass, self._async_flush_writes(device_id), f"{DOMAIN} write {device_id}")
 
-    async def update_device(self, device_id: str, update: dict) -> DeviceUpdate:
-        """Update a device."""
-        device_update = await self.client.async_update_device(device_id=device_id, update=update)
-        await self.refresh_data()
-        return device_update
-
-    async def get_snapshot(self, device_id: str) -> bytes:
-        """Get a snapshot. Caches for 10 seconds."""
-
-        if device_id in self.config_entry.runtime_data.device_snapshots_cache and self.config_entry.runtime_data.device_snapshots_cache[device_id]["expires"] > self.hass.loop.time():
-            LOGGER.debug(f"Using cached snapshot for device {device_id}")
-            return self.config_entry.runtime_data.device_snapshots_cache[device_id]["snapshot"]
-
-        LOGGER.debug(f"Fetching new snapshot for device {device_id}")
-        new_snapshot = await self.client.async_get_camera_snapshot(device_id=device_id)
-        self.config_entry.runtime_data.device_snapshots_cache[device_id] = {
-            "snapshot": new_snapshot,
-            "expires": self.hass.loop.time() + 10,
-        }
+        return await future
+
+    async def _async_flush_writes(self, device_id: str) -> None:
+        """Send the writes queued for a device as one request, in order with any earlier writes."""
+        async with self._device_write_locks.setdefault(device_id, asyncio.Lock()):
+            await asyncio.sleep(WRITE_COALESCE_WINDOW)
+            pending_writes = self._pending_writes.pop(device_id, [])
+
+            merged_update = {}
+            for pending_write in pending_writes:
+                merged_update.update(pending_write.update)
+
+            try:
+                async with self._write_semaphore:
+                    device_update = await self.client.async_update_device(
+                        device_id=device_id, update=merged_update, raise_on_error=False)
+
+                accepted = {
+                    key: value for key, value in merged_update.items()
+                    if (device_update.setStatus or {}).get(key) == "OK"
+                }
+
+                if self.optimistic_timeout and accepted and len(accepted) == len(merged_update):
+                    self.apply_optimistic_update(device_id, accepted)
+                else:
+                    try:
+                        await self.refresh_device(device_id)
+                    except StarlingHomeHubApiClientError as exception:
+                        # The hub already applied the write, so it has not failed and the next poll catches up
+                        LOGGER.warning(f"Failed to refresh device {device_id} after updating it: {exception}")
+            except Exception as exception:  # pylint: disable=broad-except
+                for pending_write in pending_writes:
+                    if not pending_write.future.done():
+                        pending_write.future.set_exception(exception)
+                return
+
+        for pending_write in pending_writes:
+            if pending_write.future.done():
+                continue
+
+            own_update = DeviceUpdate(
+                status=device_update.status,
+                setStatus={
+                    key: value for key, value in (device_update.setStatus or {}).items()
+                    if key in pending_write.update
+                },
+            )
+
+            try:
+                self.client.raise_for_set_status(own_update)
+            except HomeAssistantError as exception:
+                pending_write.future.set_exception(exception)
+            else:
+                pending_write.future.set_result(own_update)
+
+    @callback
+    def apply_optimistic_update(self, device_id: str, update: dict) -> None:
+        """Show properties the hub accepted straight away, until a poll confirms or the timeout rolls them back."""
+        device = self.config_entry.runtime_data.devices.get(device_id)
+        if device is None:
+            return
+
+        expires = self.hass.loop.time() + self.optimistic_timeout
+        pending = self._optimistic_updates.setdefault(device_id, {})
+
+        for key, value in update.items():
+            if (previous_update := pending.get(key)) is not None and previous_update.cancel_rollback is not None:
+                previous_update.cancel_rollback()
+
+            pending[key] = OptimisticUpdate(
+                value=value,
+                expires=expires,
+                cancel_rollback=async_call_later(
+                    self.hass, self.optimistic_timeout, partial(self._async_roll_back_optimistic_updates, device_id)),
+            )
+
+        changed_keys = {key for key, value in update.items() if device.properties.get(key) != value}
+
+        if changed_keys:
+            # Shown on a copy, the device may still be the one parsed from the hub's last payload
+            self.config_entry.runtime_data.devices[device_id] = replace(device, properties=device.properties.with_properties(update))
+            self.config_entry.runtime_data.changed_devices = {device_id}
+            self.device_changes = {device_id: changed_keys}
+            self.async_update_listeners()
+
+    def _reconcile_optimistic_updates(self, devices: dict[str, Device]) -> None:
+        """Reconcile freshly fetched devices with any optimistic updates still pending, replacing them with copies that show them."""
+        now = self.hass.loop.time()
+
+        for device_id in [device_id for device_id in self._optimistic_updates if device_id in devices]:
+            pending = self._optimistic_updates[device_id]
+            properties = devices[device_id].properties
+            unconfirmed = {}
+
+            for key, optimistic_update in list(pending.items()):
+                if properties.get(key) == optimistic_update.value:
+                    self._async_remove_optimistic_update(pending, key)
+                elif optimistic_update.expires <= now:
+                    LOGGER.debug(
+                        f"Rolling back unconfirmed {key} on device {device_id}")
+                    self._async_remove_optimistic_update(pending, key)
+                else:
+                    # The hub has not caught up with the write yet
+                    unconfirmed[key] = optimistic_update.value
+
+            if unconfirmed:
+                devices[device_id] = replace(devices[device_id], properties=properties.with_properties(unconfirmed))
+
+            if not pending:
+                del self._optimistic_updates[device_id]
+
+    @callback
+    def _async_remove_optimistic_update(self, pending: dict[str, OptimisticUpdate], key: str) -> None:
+        """Remove a pending optimistic update, cancelling its rollback."""
+        optimistic_update = pending.pop(key)
+        if optimistic_update.cancel_rollback is not None:
+            optimistic_update.cancel_rollback()
+
+    @callback
+    def _async_roll_back_optimistic_updates(self, device_id: str, _now: datetime) -> None:
+        """Roll back a device's expired optimistic updates to its last polled state, when no poll has confirmed them in time."""
+        if (pending := self._optimistic_updates.get(device_id)) is None:
+            return
+
+        now = self.hass.loop.time()
+        expired_keys = [key for key, optimistic_update in pending.items() if optimistic_update.expires <= now]
+        if not expired_keys:
+            return
+
+        for key in expired_keys:
+            LOGGER.debug(f"Rolling back unconfirmed {key} on device {device_id}")
+            self._async_remove_optimistic_update(pending, key)
+
+        if not pending:
+            del self._optimistic_updates[device_id]
+
+        devices = self.config_entry.runtime_data.devices
+        if (parsed := self._parsed_devices.get(device_id)) is None or (device := devices.get(device_id)) is None:
+            # Not polled since it was restored, the next poll shows the hub's state
+            return
+
+        polled_device = parsed[1]
+        if unconfirmed := {key: optimistic_update.value for key, optimistic_update in pending.items()}:
+            polled_device = replace(polled_device, properties=polled_device.properties.with_properties(unconfirmed))
+
+        devices[device_id] = polled_device
+        self.config_entry.runtime_data.changed_devices = {device_id}
+        self.device_changes = diff_devices({device_id: device}, {device_id: polled_device})
+
+        if self.device_changes:
+            self.async_update_listeners()
+
+    def get_snapshot_ttl(self, device_id: str) -> float:
+        """Get how long a snapshot of a camera is fresh for, battery cameras are woken up less often."""
+        device = self.data.devices.get(device_id) if self.data is not None else None
+        if device is not None and "batteryLevel" in device.properties:
+            return SNAPSHOT_BATTERY_TTL
+
+        return SNAPSHOT_TTL
+
+    async def get_snapshot(self, device_id: str, width: int | None = None, height: int | None = None) -> bytes:
+        """Get a snapshot, resized if a width and height are given, served from the cache while one is cached."""
+        return await self.snapshot_cache.async_get(device_id, self.get_snapshot_ttl(device_id), width, height)
+
+    @callback
+    def _async_prefetch_snapshots(self, previous_devices: dict[str, Device], data: CoordinatorData) -> None:
+        """Prefetch the snapshot of any camera that has just seen motion, a person or a doorbell push."""
+        for device_id in data.changed_devices:
+            if (device := data.devices.get(device_id)) is None or (previous_device := previous_devices.get(device_id)) is None:
+                continue
+
+            if any(
+                device.properties.get(key) and not previous_device.properties.get(key)
+                for key in SNAPSHOT_PREFETCH_PROPERTIES
+            ):
+                self.snapshot_cache.async_prefetch(device_id, self.get_snapshot_ttl(device_id))
+
+    def is_device_stale(self, device_id: str) -> bool:
+        """Return whether a device has not been fetched from the hub for the stale threshold or longer."""
+        updated = self.config_entry.runtime_data.device_updated.get(device_id)
+        return updated is None or dt_util.utcnow() - updated >= self.stale_threshold
+
+    @callback
+    def _async_update_stale_devices(self, data: CoordinatorData) -> dict[str, set[str]]:
+        """Work out which devices have gone stale or become fresh since the last update."""
+        stale_devices = {device_id for device_id in data.devices if self.is_device_stale(device_id)}
+        changes = {device_id: {AVAILABILITY_CHANGED} for device_id in stale_devices ^ self._stale_devices}
+        self._stale_devices = stale_devices
+
+        return changes
+
+    @callback
+    def _async_schedule_stale_check(self) -> None:
+        """Check again when the next fresh device reaches the stale threshold, as failed polls do not notify entities."""
+        if self._unsub_stale_check is not None:
+            self._unsub_stale_check()
+            self._unsub_stale_check = None
+
+        data = self.config_entry.runtime_data
+        next_stale = min(
+            (updated + self.stale_threshold for device_id, updated in data.device_updated.items()
+             if device_id in data.devices and device_id not in self._stale_devices),
+            default=None,
+        )
+
+        if next_stale is not None:
+            self._unsub_stale_check = async_track_point_in_utc_time(
+                self.hass, self._async_check_stale_devices, next_stale)
+
+    @callback
+    def _async_check_stale_devices(self, _now: datetime) -> None:
+        """Write the availability of devices that went stale since the last update."""
+        self._unsub_stale_check = None
+
+        if device_changes := self._async_update_stale_devices(self.config_entry.runtime_data):
+            LOGGER.debug(f"Devices went stale: {', '.join(device_changes)}")
+            self.device_changes = device_changes
+            self.async_update_listeners()
+
+        self._async_schedule_stale_check()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled calls, save the last good data, and ignore new runs."""
+        await super().async_shutdown()
+
+        if self.data is not None:
+            await self._store.async_save(self._data_to_store())
+
+        if self._unsub_stale_check is not None:
+            self._unsub_stale_check()
+            self._unsub_stale_check = None
 
-        return new_snapshot
+        for pending in self._optimistic_updates.values():
+            for key in list(pending):
+                self._async_remove_optimistic_update(pending, key)
+        self._optimistic_updates.clear()
 
-    async def fetch_data(self) -> CoordinatorData:
-        """Fetch data for the devices."""
+    def is_in_transition(self, device_id: str) -> bool:
+        """Check if a device is still moving towards its target state, or has a write the hub has not confirmed."""
+        device = self.config_entry.runtime_data.devices.get(device_id)
+        if device is None:
+            return False
 
-        devices = await self.client.async_get_devices()
-        status = await self.client.async_get_status()
+        if device_id in self._optimistic_updates:
+            return True
 
-        full_devices: dict[str, Device] = {}
-        for device in devices:
-            full_device = await self.client.async_get_device(device_id=device["id"])
-            full_devices[device["id"]] = full_device
+        properties = device.properties
+        return "currentState" in properties and "targetState" in properties and properties["currentState"] != properties["targetState"]
+
+    @callback
+    def track_transition(self, device_id: str) -> None:
+        """Poll a device on its own at short intervals until its transition finishes."""
+        if device_id in self._transition_tasks:
+            return
+
+        self._transition_tasks[device_id] = self.config_entry.async_create_background_task(
+            self.hass, self._async_track_transition(device_id), f"{DOMAIN} transition {device_id}")
+
+    async def _async_track_transition(self, device_id: str) -> None:
+        """Poll a device with backoff until it reaches its target state or the timeout passes."""
+        deadline = self.hass.loop.time() + TRANSITION_TIMEOUT
+        interval = TRANSITION_POLL_INTERVAL
+
+        try:
+            while self.hass.loop.time() < deadline:
+                await asyncio.sleep(interval)
+
+                try:
+                    await self.refresh_device(device_id)
+                except StarlingHomeHubApiClientError as exception:
+                    LOGGER.debug(
+                        f"Failed to poll device {device_id} in transition: {exception}")
+
+                if not self.is_in_transition(device_id):
+                    LOGGER.debug(f"Device {device_id} finished its transition")
+                    return
+
+                interval = min(interval * TRANSITION_POLL_BACKOFF,
+                               TRANSITION_POLL_MAX_INTERVAL)
+
+            LOGGER.debug(
+                f"Device {device_id} did not finish its transition in time")
+        finally:
+            self._transition_tasks.pop(device_id, None)
+
+    def get_poll_interval(self, category: str) -> float:
+        """Get the polling interval in seconds for a device category."""
+        if category in self.fast_poll_categories:
+            return FAST_POLL_INTERVAL.total_seconds()
+
+        if category in self.slow_poll_categories:
+            return SLOW_POLL_INTERVAL.total_seconds()
+
+        return NORMAL_POLL_INTERVAL.total_seconds()
+
+    async def fetch_data(self, poll_all: bool = False) -> CoordinatorData:
+        """Fetch data for the devices that are due to be polled, or all of them."""
+
+        now = self.hass.loop.time()
+        previous_data: CoordinatorData | None = self.data
+
+        if poll_all or previous_data is None or now >= self._next_device_list_poll:
+            try:
+                devices, status = await asyncio.gather(
+                    self.client.async_get_devices(),
+                    self.client.async_get_status(),
+                )
+            except StarlingHomeHubApiClientError:
+                self._hub_failing = True
+                raise
+
+            self._hub_failing = False
+
+            self._device_categories = {
+                device["id"]: device["category"] for device in devices}
+            self.snapshot_cache.async_retain(self._device_categories)
+            self._parsed_devices = {
+                device_id: parsed for device_id, parsed in self._parsed_devices.items() if device_id in self._device_categories}
+            self._next_device_list_poll = now + NORMAL_POLL_INTERVAL.total_seconds()
+        else:
+            status = previous_data.status
+
+        due_device_ids = [
+            device_id for device_id in self._device_categories
+            if poll_all or previous_data is None or device_id not in previous_data.devices
+            or self._next_device_poll.get(device_id, 0) <= now
+        ]
+
+        parsed_devices = {device_id: self._parsed_devices.get(device_id) for device_id in due_device_ids}
+
+        # The client bounds how many of these run against the hub at once
+        results = await asyncio.gather(
+            *(
+                self.client.async_get_device_if_changed(device_id=device_id, digest=parsed[0] if parsed else None)
+                for device_id, parsed in parsed_devices.items()
+            ),
+            return_exceptions=True,
+        )
+
+        fetched_devices: dict[str, Device] = {}
+        failed_devices: dict[str, Exception] = {}
+        for device_id, result in zip(due_device_ids, results):
+            if isinstance(result, StarlingHomeHubApiClientError) and not isinstance(result, StarlingHomeHubApiClientAuthenticationError):
+                failed_devices[device_id] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                digest, device = result
+                # An unchanged payload keeps the device it was parsed into last time
+                device = device or parsed_devices[device_id][1]
+                self._parsed_devices[device_id] = (digest, device)
+                fetched_devices[device_id] = device
+
+        if failed_devices and not fetched_devices:
+            # Nothing answered, so the hub itself is having trouble
+            self._hub_failing = True
+            raise next(iter(failed_devices.values()))
+
+        if not fetched_devices and (self._hub_failing or self.client.circuit_breaker.state != CircuitState.CLOSED):
+            # Most ticks only poll a few devices, if any, so a quiet tick does not mean the hub has recovered
+            raise StarlingHomeHubApiClientCommunicationError("Hub is not responding, waiting for it to recover")
+
+        self._hub_failing = False
+
+        for device_id, exception in failed_devices.items():
+            LOGGER.debug(f"Failed to fetch device {device_id}, keeping its last known state: {exception}")
+
+        self._reconcile_optimistic_updates(fetched_devices)
+
+        # Failed devices wait out their interval too, so one broken device is not hammered every tick
+        self._next_device_poll = {
+            device_id: now + self.get_poll_interval(self._device_categories[device_id])
+            if device_id in fetched_devices or device_id in failed_devices else self._next_device_poll[device_id]
+            for device_id in self._device_categories
+        }
+
+        previous_devices = previous_data.devices if previous_data else {}
+        full_devices: dict[str, Device] = {
+            device_id: device
+            for device_id in self._device_categories
+            if (device := fetched_devices.get(device_id) or previous_devices.get(device_id))
+        }
+
+        updated = dt_util.utcnow()
+        device_updated = {
+            **{device_id: timestamp for device_id, timestamp in (previous_data.device_updated if previous_data else {}).items()
+               if device_id in full_devices},
+            **dict.fromkeys(fetched_devices, updated),
+        }
+
+        changed_devices = {
+            device_id for device_id, device in full_devices.items() if previous_devices.get(device_id) is not device
+        } | (previous_devices.keys() - full_devices.keys())
 
         self.config_entry.runtime_data = CoordinatorData(
-            devices=full_devices, status=status)
+            devices=full_devices, status=status, device_updated=device_updated, changed_devices=changed_devices)
 
         return self.config_entry.runtime_data
 
+    async def async_restore_data(self) -> bool:
+        """Restore the last good data saved for this hub, so platforms can be set up before it answers."""
+        stored_data = await self._store.async_load()
+        if not stored_data:
+            return False
+
+        try:
+            data = CoordinatorData(
+                devices={
+                    device_id: Device.create_from_dict(device) for device_id, device in stored_data["devices"].items()
+                },
+                status=Status.create_from_dict(stored_data["status"]),
+                device_updated={
+                    device_id: dt_util.parse_datetime(updated)
+                    for device_id, updated in stored_data.get("device_updated", {}).items()
+                    if device_id in stored_data["devices"]
+                },
+            )
+            data.changed_devices = set(data.devices)
+        except (KeyError, TypeError) as exception:
+            LOGGER.warning(f"Ignoring saved data that could not be restored: {exception}")
+            return False
+
+        LOGGER.debug(f"Restored {len(data.devices)} devices from saved data")
+
+        self._device_categories = {
+            device_id: device.properties["category"] for device_id, device in data.devices.items()}
+        self.config_entry.runtime_data = data
+        # Entities of devices saved too long ago are set up unavailable, so the first live update writes them back
+        self._stale_devices = {device_id for device_id in data.devices if self.is_device_stale(device_id)}
+        self.async_set_updated_data(data)
+        self._async_schedule_stale_check()
+
+        return True
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the current data, at most once every save interval and when Home Assistant stops."""
+        now = self.hass.loop.time()
+        if now < self._next_store_save:
+            return
+
+        self._next_store_save = now + STORAGE_SAVE_INTERVAL
+        self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_INTERVAL)
+
+    @callback
+    def _data_to_store(self) -> dict:
+        """Get the data to save for the next startup."""
+        data = self.config_entry.runtime_data
+
+        return {
+            "devices": {device_id: device.as_dict() for device_id, device in data.devices.items()},
+            "status": asdict(data.status),
+            "device_updated": {device_id: updated.isoformat() for device_id, updated in data.device_updated.items()},
+        }
+
     async def refresh_data(self) -> bool:
         """Refresh data."""
-        data = await self.fetch_data()
+        data = await self.fetch_data(poll_all=True)
+        self.device_changes = None
         self.async_set_updated_data(data)
 
         return True
 
+    async def refresh_device(self, device_id: str) -> bool:
+        """Refresh a single device and notify listeners, without polling the rest of the hub."""
+        parsed = self._parsed_devices.get(device_id)
+
+        # Follows a user's write or a device they set moving, so it goes ahead of background polls
+        digest, device = await self.client.async_get_device_if_changed(
+            device_id=device_id, digest=parsed[0] if parsed else None, priority=RequestPriority.USER)
+        device = device or parsed[1]
+        self._parsed_devices[device_id] = (digest, device)
+
+        fetched_devices = {device_id: device}
+        self._reconcile_optimistic_updates(fetched_devices)
+        device = fetched_devices[device_id]
+
+        devices = self.config_entry.runtime_data.devices
+        previous_device = devices.get(device_id)
+        devices[device_id] = device
+        self.config_entry.runtime_data.device_updated[device_id] = dt_util.utcnow()
+        self.config_entry.runtime_data.changed_devices = {device_id} if device is not previous_device else set()
+
+        # Polling the device on its own counts towards its schedule
+        if (category := self._device_categories.get(device_id)) is not None:
+            self._next_device_poll[device_id] = self.hass.loop.time() + self.get_poll_interval(category)
+
+        self.device_changes = diff_devices(
+            {device_id: previous_device} if previous_device else {}, {device_id: device})
+        for stale_device_id, changed_keys in self._async_update_stale_devices(self.config_entry.runtime_data).items():
+            self.device_changes.setdefault(stale_device_id, set()).update(changed_keys)
+        self._async_schedule_stale_check()
+
+        if self.device_changes:
+            self.async_update_listeners()
+
+        return True
+
     async def _async_update_data(self) -> CoordinatorData:
         """Update data via library."""
 
+        previous_data: CoordinatorData | None = self.data
+
         try:
-            return await self.fetch_data()
+            data = await self.fetch_data()
         except StarlingHomeHubApiClientAuthenticationError as exception:
+            self.device_changes = None
             raise ConfigEntryAuthFailed(exception) from exception
         except StarlingHomeHubApiClientError as exception:
+            # Entities keep serving the last known good data, the stale check writes them as their devices go stale
+            self.device_changes = {} if previous_data is not None else None
             raise UpdateFailed(exception) from exception
+
+        if previous_data is None or not self.last_update_success:
+            # Every entity needs to write its state, if only to become available again
+            self.device_changes = None
+        else:
+            self.device_changes = diff_devices(
+                previous_data.devices, data.devices, data.changed_devices)
+
+        stale_changes = self._async_update_stale_devices(data)
+        if self.device_changes is not None:
+            for device_id, changed_keys in stale_changes.items():
+                self.device_changes.setdefault(device_id, set()).update(changed_keys)
+
+        # Saved even without changes, so the saved update times stay fresh enough to restore devices as available
+        self._async_schedule_save()
+
+        if self.prefetch_snapshots and previous_data is not None:
+            self._async_prefetch_snapshots(previous_data.devices, data)
+
+        self._async_schedule_stale_check()
+
+        return data
@@ -0,0 +1,44 @@
+"""Diagnostics support for Starling Home Hub."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_API_KEY
+from homeassistant.core import HomeAssistant
+
+from custom_components.starling_home_hub.const import CONF_RTSP_PASSWORD, CONF_RTSP_USERNAME, DOMAIN
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubConfigEntry, StarlingHomeHubDataUpdateCoordinator
+
+TO_REDACT = {CONF_API_KEY, CONF_RTSP_USERNAME, CONF_RTSP_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: StarlingHomeHubConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    client = coordinator.client
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "last_update_success": coordinator.last_update_success,
+        "devices": {
+            device_id: device.properties["category"]
+            for device_id, device in entry.runtime_data.devices.items()
+        },
+        "platforms": list(coordinator.platforms),
+        "circuit_breaker": {
+            "state": client.circuit_breaker.state.value,
+            "consecutive_failures": client.circuit_breaker.failures,
+        },
+        "scheduler": client.scheduler.as_dict(),
+        "latency": client.latency.as_dict(),
+        "hedging": {
+            "hedged_requests": client.hedged_requests,
+            "hedge_wins": client.hedge_wins,
+        },
+    }
@@ -1,25 +1,70 @@
 """Contains entities that integrate directly with Home Assistant."""
 
 from __future__ import annotations
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from custom_components.starling_home_hub.const import ATTRIBUTION, DOMAIN
-from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
+from custom_components.starling_home_hub.coordinator import AVAILABILITY_CHANGED, StarlingHomeHubDataUpdateCoordinator
 from custom_components.starling_home_hub.models.api.device import Device
 
 
 DeviceType = TypeVar("D")
 
 
+class PropertyKeyRecorder(dict):
+    """Device properties that record which keys are read from them."""
+
+    def __init__(self, properties: dict) -> None:
+        """Initialize."""
+        super().__init__(properties)
+        self.keys_read: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        """Record and return a property."""
+        self.keys_read.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Record and check for a property."""
+        self.keys_read.add(key)
+        return super().__contains__(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Record and return a property."""
+        self.keys_read.add(key)
+        return super().get(key, default)
+
+
+def read_property_keys(properties: dict, entity_description: Any) -> frozenset[str] | None:
+    """Work out which device properties an entity description's functions read, or None if that cannot be told."""
+    recorder = PropertyKeyRecorder(properties)
+
+    for fn_name in ("relevant_fn", "value_fn", "icon_fn"):
+        fn = getattr(entity_description, fn_name, None)
+        if fn is None:
+            continue
+
+        try:
+            fn(recorder)
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    return frozenset(recorder.keys_read) or None
+
+
 class StarlingHomeHubEntity(CoordinatorEntity):
     """StarlingHomeHubEntity class."""
 
     device_id: str
 
+    # The device properties this entity's state depends on, None if it depends on all of them.
+    # Entities with an entity description have these worked out from its functions.
+    property_keys: frozenset[str] | None = None
+
     _attr_attribution = ATTRIBUTION
     coordinator: StarlingHomeHubDataUpdateCoordinator
 
@@ -46,11 +91,35 @@ class StarlingHomeHubEntity(CoordinatorEntity):
             serial_number=device_properties["serialNumber"]
         )
 
+        if self.property_keys is None and hasattr(self, "entity_description"):
+            self.property_keys = read_property_keys(
+                device_properties, self.entity_description)
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator, only writing state if a property it depends on changed."""
+        device_changes = self.coordinator.device_changes
+
+        if device_changes is not None:
+            changed_keys = device_changes.get(self.device_id)
+
+            if not changed_keys:
+                return
+
+            if (
+                self.property_keys is not None
+                and self.property_keys.isdisjoint(changed_keys)
+                and AVAILABILITY_CHANGED not in changed_keys
+            ):
+                return
+
         self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return True if this device has been fetched recently, serving its last known state through short outages."""
+        return not self.coordinator.is_device_stale(self.device_id)
+
     def get_device(self) -> Device:
         """Get the actual device data from coordinator."""
         return self.coordinator.config_entry.runtime_data.devices.get(self.device_id)
@@ -11,6 +11,8 @@ from homeassistant.components.stream import CONF_EXTRA_PART_WAIT_TIME
 from custom_components.starling_home_hub.const import LOGGER
 from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
 from custom_components.starling_home_hub.entities import StarlingHomeHubEntity
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.device.camera import CameraDevice
 
 
 PLACEHOLDER = Path(__file__).parent.parent / "camera_placeholder.png"
@@ -19,6 +21,8 @@ PLACEHOLDER = Path(__file__).parent.parent / "camera_placeholder.png"
 class StarlingHomeHubBaseCamera(StarlingHomeHubEntity, Camera):
     """Base class for Starling Home Hub camera entities."""
 
+    property_keys = frozenset({"isOnline", "cameraEnabled"})
+
     def __init__(
         self,
         device_id: str,
@@ -37,9 +41,13 @@ class StarlingHomeHubBaseCamera(StarlingHomeHubEntity, Camera):
         Camera.__init__(self)
 
         device = self.get_device()
-        self._attr_name = device.properties["name"]
+        self._attr_name = device.properties.name
         self.stream_options[CONF_EXTRA_PART_WAIT_TIME] = 3
 
+    def get_device(self) -> Device[CameraDevice]:
+        """Get the actual device data from coordinator."""
+        return super().get_device()
+
     @classmethod
     @functools.cache
     def placeholder_image(cls) -> bytes:
@@ -50,13 +58,18 @@ class StarlingHomeHubBaseCamera(StarlingHomeHubEntity, Camera):
     def available(self) -> bool:
         """Return True if entity is available."""
         device = self.get_device()
-        return device is not None and device.properties.get("cameraEnabled", False) and device.properties.get("isOnline", False)
+        return (
+            device is not None
+            and bool(device.properties.cameraEnabled)
+            and bool(device.properties.isOnline)
+            and not self.coordinator.is_device_stale(self.device_id)
+        )
 
     @property
     def is_on(self) -> bool:
         """Return True if the camera is on."""
         device = self.get_device()
-        return device is not None and device.properties.get("cameraEnabled", False)
+        return device is not None and bool(device.properties.cameraEnabled)
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
@@ -64,7 +77,7 @@ class StarlingHomeHubBaseCamera(StarlingHomeHubEntity, Camera):
         """Return bytes of camera image."""
 
         try:
-            return await self.coordinator.get_snapshot(self.device_id)
+            return await self.coordinator.get_snapshot(self.device_id, width, height)
         except Exception as e:
             LOGGER.error(f"Error fetching camera image for {
                          self.device_id}: {e}")
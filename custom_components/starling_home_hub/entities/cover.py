@@ -40,6 +40,8 @@ class StarlingHomeHubCoverEntity(StarlingHomeHubEntity, CoverEntity):
         self._attr_has_entity_name = True
         self.device_class = entity_description.device_class
         self._attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
+        self.property_keys = frozenset(
+            {entity_description.current_state_field, entity_description.target_state_field})
 
         super().__init__(coordinator)
 
@@ -63,9 +65,11 @@ class StarlingHomeHubCoverEntity(StarlingHomeHubEntity, CoverEntity):
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.target_state_field: "open"
         })
+        self.coordinator.track_transition(self.device_id)
 
     async def async_close_cover(self, **kwargs):
         """Close cover."""
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.target_state_field: "closed"
         })
+        self.coordinator.track_transition(self.device_id)
@@ -12,6 +12,8 @@ from custom_components.starling_home_hub.entities import StarlingHomeHubEntity
 class StarlingHomeHubFanEntity(StarlingHomeHubEntity, FanEntity):
     """Starling Home Hub Fan Entity class."""
 
+    property_keys = frozenset({"isOn", "fanSpeed"})
+
     def __init__(
         self,
         device_id: str,
@@ -0,0 +1,82 @@
+"""Starling Home Hub entities that describe the hub itself rather than one of its devices."""
+
+from __future__ import annotations
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.typing import StateType
+
+from custom_components.starling_home_hub.circuit_breaker import CircuitState
+from custom_components.starling_home_hub.const import ATTRIBUTION, DOMAIN
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
+
+
+class StarlingHomeHubHubEntity(CoordinatorEntity):
+    """Base class for entities on the hub's own device."""
+
+    _attr_attribution = ATTRIBUTION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+    coordinator: StarlingHomeHubDataUpdateCoordinator
+
+    def __init__(self, coordinator: StarlingHomeHubDataUpdateCoordinator, key: str) -> None:
+        """Initialize."""
+
+        super().__init__(coordinator)
+
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{entry_id}-{key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=coordinator.config_entry.title,
+            manufacturer="Starling",
+            model="Home Hub",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True, the hub's diagnostics are most useful while it is failing."""
+        return True
+
+
+class StarlingHomeHubCircuitBreakerSensor(StarlingHomeHubHubEntity, SensorEntity):
+    """Starling Home Hub sensor showing the state of the client's circuit breaker."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = [state.value for state in CircuitState]
+    _attr_name = "Circuit Breaker"
+    _attr_icon = "mdi:electric-switch"
+
+    def __init__(self, coordinator: StarlingHomeHubDataUpdateCoordinator) -> None:
+        """Initialize the Circuit Breaker Sensor class."""
+
+        self._written_state: tuple[str, int] | None = None
+
+        super().__init__(coordinator, "circuit_breaker")
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.client.circuit_breaker.state.value
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return how many requests have failed in a row."""
+        return {"consecutive_failures": self.coordinator.client.circuit_breaker.failures}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, only writing state if the breaker changed."""
+        circuit_breaker = self.coordinator.client.circuit_breaker
+        if (circuit_breaker.state.value, circuit_breaker.failures) != self._written_state:
+            self.async_write_ha_state()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was written."""
+        circuit_breaker = self.coordinator.client.circuit_breaker
+        self._written_state = (circuit_breaker.state.value, circuit_breaker.failures)
+        super().async_write_ha_state()
@@ -25,6 +25,9 @@ DEFAULT_MAX_KELVIN = 6535  # 153 mireds
 class StarlingHomeHubLightEntity(StarlingHomeHubEntity, LightEntity):
     """Light entity class."""
 
+    property_keys = frozenset(
+        {"isOnline", "isOn", "brightness", "colorTemperature", "hue", "saturation"})
+
     def __init__(
         self, device_id: str, coordinator: StarlingHomeHubDataUpdateCoordinator
     ) -> None:
@@ -100,7 +103,11 @@ class StarlingHomeHubLightEntity(StarlingHomeHubEntity, LightEntity):
     @property
     def available(self) -> bool:
         """Return device availability."""
-        return self.get_device() is not None and self.get_device().properties["isOnline"]
+        return (
+            self.get_device() is not None
+            and self.get_device().properties["isOnline"]
+            and not self.coordinator.is_device_stale(self.device_id)
+        )
 
     @property
     def is_on(self) -> bool:
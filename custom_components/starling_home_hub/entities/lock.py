@@ -38,6 +38,8 @@ class StarlingHomeHubLockEntity(StarlingHomeHubEntity, LockEntity):
         self.entity_description = entity_description
         self._attr_unique_id = f"{device_id}-{self.entity_description.key}"
         self._attr_has_entity_name = True
+        self.property_keys = frozenset(
+            {"currentState", entity_description.current_state_field, entity_description.target_state_field})
 
         super().__init__(coordinator)
 
@@ -46,12 +48,14 @@ class StarlingHomeHubLockEntity(StarlingHomeHubEntity, LockEntity):
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.target_state_field: "locked"
         })
+        self.coordinator.track_transition(self.device_id)
 
     async def async_unlock(self, **kwargs):
         """Unlock all or specified locks. A code to unlock the lock with may optionally be specified."""
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.target_state_field: "unlocked"
         })
+        self.coordinator.track_transition(self.device_id)
 
     @property
     def icon(self) -> str | None:
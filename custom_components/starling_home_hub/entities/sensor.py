@@ -7,7 +7,9 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.typing import StateType
 
 from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
@@ -22,6 +24,17 @@ class StarlingHomeHubSensorEntityDescription(SensorEntityDescription):
     relevant_fn: Callable[[DeviceType], StateType] | None = None
 
 
+# Every device with entities on a platform also gets a sensor showing how old its data is
+DATA_AGE_ENTITY_DESCRIPTION = SensorEntityDescription(
+    key="data_age",
+    name="Data Age",
+    device_class=SensorDeviceClass.TIMESTAMP,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    # Changes on every poll of the device, so is only recorded for those who ask for it
+    entity_registry_enabled_default=False,
+)
+
+
 class StarlingHomeHubSensorEntity(StarlingHomeHubEntity, SensorEntity):
     """Starling Home Hub Sensor Entity class."""
 
@@ -45,3 +58,41 @@ class StarlingHomeHubSensorEntity(StarlingHomeHubEntity, SensorEntity):
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.get_device().properties)
+
+
+class StarlingHomeHubDataAgeSensor(StarlingHomeHubEntity, SensorEntity):
+    """Starling Home Hub sensor showing when a device's data was last fetched from the hub."""
+
+    def __init__(
+        self,
+        device_id: str,
+        coordinator: StarlingHomeHubDataUpdateCoordinator,
+        entity_description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the Data Age Sensor class."""
+
+        self.device_id = device_id
+        self.coordinator = coordinator
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{device_id}-{self.entity_description.key}"
+        self._attr_has_entity_name = True
+        self._written_value: datetime | None = None
+
+        super().__init__(coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return True, the age of a device's data matters most while it is stale."""
+        return self.get_device() is not None
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return when the device was last fetched."""
+        return self.coordinator.config_entry.runtime_data.device_updated.get(self.device_id)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, only writing state if the device was fetched."""
+        if self.native_value != self._written_value:
+            self._written_value = self.native_value
+            self.async_write_ha_state()
@@ -9,6 +9,8 @@ from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
 from custom_components.starling_home_hub.entities import StarlingHomeHubEntity
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.device.thermostat import ThermostatDevice
 
 MIN_TEMP = 10
 MAX_TEMP = 32
@@ -31,6 +33,11 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
     _attr_max_temp = MAX_TEMP
     _attr_has_entity_name = True
 
+    property_keys = frozenset({
+        "isOnline", "currentTemperature", "targetTemperature", "targetCoolingThresholdTemperature",
+        "targetHeatingThresholdTemperature", "hvacMode", "hvacState", "fanRunning",
+    })
+
     def __init__(
         self,
         device_id: str,
@@ -45,16 +52,16 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
         self._attr_supported_features = self._get_supported_features()
         self._attr_name = "Thermostat"
 
-        device = self.get_device()
+        properties = self.get_device().properties
 
         self._attr_hvac_modes = []
-        if device.properties["canHeat"]:
+        if properties.canHeat:
             self._attr_hvac_modes.append(HVACMode.HEAT)
 
-        if device.properties["canCool"]:
+        if properties.canCool:
             self._attr_hvac_modes.append(HVACMode.COOL)
 
-        if device.properties["canHeatCool"]:
+        if properties.canHeatCool:
             self._attr_hvac_modes.append(HVACMode.HEAT_COOL)
 
         if len(self._attr_hvac_modes) > 0:
@@ -62,28 +69,26 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
 
         super().__init__(coordinator)
 
+    def get_device(self) -> Device[ThermostatDevice]:
+        """Get the actual device data from coordinator."""
+        return super().get_device()
+
     @property
     def available(self) -> bool:
         """Return device availability."""
         device = self.get_device()
-        return device is not None and device.properties["isOnline"]
+        return device is not None and bool(device.properties.isOnline) and not self.coordinator.is_device_stale(self.device_id)
 
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        device = self.get_device()
-        if "currentTemperature" not in device.properties:
-            return None
-
-        return device.properties["currentTemperature"]
+        return self.get_device().properties.currentTemperature
 
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature currently set to be reached."""
-        device = self.get_device()
-
-        if "targetTemperature" in device.properties and self.hvac_mode == HVACMode.HEAT or self.hvac_mode == HVACMode.COOL:
-            return device.properties["targetTemperature"]
+        if self.hvac_mode in (HVACMode.HEAT, HVACMode.COOL):
+            return self.get_device().properties.targetTemperature
 
         return None
 
@@ -93,12 +98,7 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
         if self.hvac_mode != HVACMode.HEAT_COOL:
             return None
 
-        device = self.get_device()
-
-        if "targetCoolingThresholdTemperature" in device.properties:
-            return device.properties["targetCoolingThresholdTemperature"]
-
-        return None
+        return self.get_device().properties.targetCoolingThresholdTemperature
 
     @property
     def target_temperature_low(self) -> float | None:
@@ -106,17 +106,12 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
         if self.hvac_mode != HVACMode.HEAT_COOL:
             return None
 
-        device = self.get_device()
-
-        if "targetHeatingThresholdTemperature" in device.properties:
-            return device.properties["targetHeatingThresholdTemperature"]
-
-        return None
+        return self.get_device().properties.targetHeatingThresholdTemperature
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the current operation (e.g. heat, cool, idle)."""
-        hvacMode = self.get_device().properties["hvacMode"]
+        hvacMode = self.get_device().properties.hvacMode
 
         if hvacMode == "heat":
             return HVACMode.HEAT
@@ -130,7 +125,7 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current HVAC action (heating, cooling)."""
-        hvacState = self.get_device().properties["hvacState"]
+        hvacState = self.get_device().properties.hvacState
 
         if hvacState == "off" and self.hvac_mode != HVACMode.OFF:
             return HVACAction.IDLE
@@ -148,20 +143,20 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
         """Compute the bitmap of supported features from the current state."""
         features = ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
 
-        device = self.get_device()
+        properties = self.get_device().properties
 
-        if device.properties["canHeatCool"]:
+        if properties.canHeatCool:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
 
-        if device.properties["canHeat"] or device.properties["canCool"]:
+        if properties.canHeat or properties.canCool:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE
 
         # todo: preset support
-        # if "presetsAvailable" in device.properties:
+        # if properties.presetsAvailable is not None:
         #     features |= ClimateEntityFeature.PRESET_MODE
 
         # Enable fan support
-        if "fanRunning" in device.properties:
+        if properties.fanRunning is not None:
             features |= ClimateEntityFeature.FAN_MODE
 
         return features
@@ -177,7 +172,7 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
     @property
     def fan_mode(self) -> str:
         """Return the current fan mode."""
-        if (self.supported_features & ClimateEntityFeature.FAN_MODE) and self.get_device().properties["fanRunning"]:
+        if (self.supported_features & ClimateEntityFeature.FAN_MODE) and self.get_device().properties.fanRunning:
             return FAN_ON
 
         return FAN_OFF
@@ -185,10 +180,16 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
 
+        # A mode change and a setpoint change are sent to the hub as a single update
+        update = {}
+
         hvac_mode = self.hvac_mode
         if kwargs.get(ATTR_HVAC_MODE) is not None:
             hvac_mode = kwargs[ATTR_HVAC_MODE]
-            await self.async_set_hvac_mode(hvac_mode)
+            if hvac_mode not in self.hvac_modes:
+                raise ValueError(f"Unsupported hvac_mode '{hvac_mode}'")
+
+            update["hvacMode"] = THERMOSTAT_INV_MODE_MAP[hvac_mode]
 
         low_temp = kwargs.get(ATTR_TARGET_TEMP_LOW)
         high_temp = kwargs.get(ATTR_TARGET_TEMP_HIGH)
@@ -205,18 +206,16 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
                         else:
                             low_temp = high_temp - MIN_TEMP_RANGE
 
-                    await self.coordinator.update_device(
-                        device_id=self.device_id,
-                        update={"targetCoolingThresholdTemperature": high_temp,
-                                "targetHeatingThresholdTemperature": low_temp}
-                    )
+                    update["targetCoolingThresholdTemperature"] = high_temp
+                    update["targetHeatingThresholdTemperature"] = low_temp
             elif (hvac_mode == HVACMode.HEAT or hvac_mode == HVACMode.COOL) and temp:
+                update["targetTemperature"] = temp
+
+            if update:
                 await self.coordinator.update_device(
                     device_id=self.device_id,
-                    update={"targetTemperature": temp}
+                    update=update
                 )
-
-            await self.coordinator.refresh_data()
         except Exception as err:
             raise HomeAssistantError(
                 f"Error setting {self.entity_id} temperature to {
@@ -235,8 +234,6 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
                 device_id=self.device_id,
                 update={"hvacMode": api_mode}
             )
-
-            await self.coordinator.refresh_data()
         except Exception as err:
             raise HomeAssistantError(
                 f"Error setting {self.entity_id} HVAC mode to {
@@ -255,7 +252,6 @@ class StarlingHomeHubThermostatEntity(StarlingHomeHubEntity, ClimateEntity):
                 device_id=self.device_id,
                 update={"fanRunning": fan_state}
             )
-            await self.coordinator.refresh_data()
         except Exception as err:
             raise HomeAssistantError(
                 f"Error setting {self.entity_id} fan mode to {fan_mode}: {err}"
@@ -52,9 +52,11 @@ class StarlingHomeHubValveEntity(StarlingHomeHubEntity, ValveEntity):
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.update_field: True
         })
+        self.coordinator.track_transition(self.device_id)
 
     async def async_close_valve(self) -> None:
         """Close the valve."""
         await self.coordinator.update_device(self.device_id, {
             self.entity_description.update_field: False
         })
+        self.coordinator.track_transition(self.device_id)
@@ -0,0 +1,94 @@
+"""Plans the entities each platform creates for the devices of a Starling Home Hub."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.helpers.entity import EntityDescription
+
+from custom_components.starling_home_hub.const import PLATFORMS
+from custom_components.starling_home_hub.entities.sensor import DATA_AGE_ENTITY_DESCRIPTION
+from custom_components.starling_home_hub.integrations import get_device_category_platforms
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.coordinator import EntityPlan
+
+# Platforms that create an entity for each device they match, rather than from entity descriptions
+DEVICE_PLATFORM_FILTERS: dict[Platform, Callable[[Mapping[str, Any]], bool]] = {
+    Platform.CAMERA: lambda properties: properties["category"] == "cam",
+    Platform.CLIMATE: lambda properties: properties["type"] == "thermostat",
+    Platform.FAN: lambda properties: properties["category"] == "fan",
+    Platform.LIGHT: lambda properties: properties["type"] == "light" or properties["category"] == "diffuser",
+}
+
+# Planned for devices matched by a platform filter, whose entity describes itself
+DEVICE_ENTITY_DESCRIPTION = EntityDescription(key="device")
+
+# Platforms that are needed whatever devices the hub has, for the hub's own entities
+HUB_PLATFORMS = frozenset({Platform.SENSOR})
+
+# Entities every device gets whatever its category, as long as it has entities on some platform
+DEVICE_ENTITY_DESCRIPTIONS: dict[Platform, list[EntityDescription]] = {
+    Platform.SENSOR: [DATA_AGE_ENTITY_DESCRIPTION],
+}
+
+
+def plan_device(properties: Mapping[str, Any]) -> dict[Platform, list[EntityDescription]]:
+    """Work out which entity descriptions each platform creates for a device, expanding any factories."""
+    device_plan: dict[Platform, list[EntityDescription]] = {}
+
+    for platform, platform_descriptions in get_device_category_platforms(properties["category"]).items():
+        entity_descriptions: list[EntityDescription] = []
+
+        for entity_description in platform_descriptions:
+            if hasattr(entity_description, "make_entity_descriptions"):
+                entity_descriptions.extend(
+                    entity_description.make_entity_descriptions(properties))
+            else:
+                entity_descriptions.append(entity_description)
+
+        if relevant_descriptions := [
+            entity_description for entity_description in entity_descriptions
+            if not entity_description.relevant_fn or entity_description.relevant_fn(properties)
+        ]:
+            device_plan[platform] = relevant_descriptions
+
+    for platform, device_filter in DEVICE_PLATFORM_FILTERS.items():
+        if device_filter(properties):
+            device_plan.setdefault(platform, []).append(DEVICE_ENTITY_DESCRIPTION)
+
+    if device_plan:
+        for platform, entity_descriptions in DEVICE_ENTITY_DESCRIPTIONS.items():
+            device_plan[platform] = [*device_plan.get(platform, []), *entity_descriptions]
+
+    return device_plan
+
+
+def build_entity_plan(devices: dict[str, Device]) -> EntityPlan:
+    """Plan the entities of every platform in a single pass over the devices.
+
+    Entity descriptions only look at which properties a device has, so a device's plan is
+    cached by its category, type and property keys and reused for every device that shares them.
+    """
+    device_plans: dict[tuple[str, str, frozenset[str]], dict[Platform, list[EntityDescription]]] = {}
+    entity_plan: EntityPlan = {}
+
+    for device_id, device in devices.items():
+        signature = (device.properties["category"], device.properties["type"], frozenset(device.properties))
+
+        if (device_plan := device_plans.get(signature)) is None:
+            device_plan = device_plans[signature] = plan_device(device.properties)
+
+        for platform, entity_descriptions in device_plan.items():
+            entity_plan.setdefault(platform, []).extend(
+                (device_id, entity_description) for entity_description in entity_descriptions)
+
+    return entity_plan
+
+
+def get_platforms(entity_plan: EntityPlan) -> list[Platform]:
+    """Work out which platforms have entities to create, in the order they are set up."""
+    platforms = HUB_PLATFORMS | entity_plan.keys()
+
+    return [platform for platform in PLATFORMS if platform in platforms]
@@ -1,5 +1,6 @@
 """Fan entity for Starling Home Hub."""
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -14,10 +15,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
     coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[StarlingHomeHubFanEntity] = []
 
-    for device in filter(lambda device: device[1].properties["category"] == "fan", entry.runtime_data.devices.items()):
+    for device_id, _ in coordinator.entity_plan.get(Platform.FAN, []):
         entities.append(
             StarlingHomeHubFanEntity(
-                device_id=device[0],
+                device_id=device_id,
                 coordinator=coordinator
             )
         )
@@ -1,43 +1,67 @@
-"""Contains home assistant integrations for the Starling Home Hub. These generally align to the different device categories."""
-
-from custom_components.starling_home_hub.integrations.camera import CAMERA_PLATFORMS
-from custom_components.starling_home_hub.integrations.diffuser import DIFFUSER_PLATFORMS
-from custom_components.starling_home_hub.integrations.fan import FAN_PLATFORMS
-from custom_components.starling_home_hub.integrations.garage import GARAGE_PLATFORMS
-from custom_components.starling_home_hub.integrations.heater_cooler import HEATER_COOLER_PLATFORMS
-from custom_components.starling_home_hub.integrations.home_away_control import HOME_AWAY_CONTROL_PLATFORMS
-from custom_components.starling_home_hub.integrations.humidifier_dehumidifier import HUMIDIFIER_DEHUMIDIFIER_PLATFORMS
-from custom_components.starling_home_hub.integrations.kettle import KETTLE_PLATFORMS
-from custom_components.starling_home_hub.integrations.light import LIGHT_PLATFORMS
-from custom_components.starling_home_hub.integrations.lock import LOCK_PLATFORMS
-from custom_components.starling_home_hub.integrations.open_close import OPEN_CLOSE_PLATFORMS
-from custom_components.starling_home_hub.integrations.outlet import OUTLET_PLATFORMS
-from custom_components.starling_home_hub.integrations.purifier import PURIFIER_PLATFORMS
-from custom_components.starling_home_hub.integrations.robot import ROBOT_PLATFORMS
-from custom_components.starling_home_hub.integrations.sensor import SENSOR_PLATFORMS
-from custom_components.starling_home_hub.integrations.smoke_co_detector import SMOKE_CO_DETECTOR_PLATFORMS
-from custom_components.starling_home_hub.integrations.switch import SWITCH_PLATFORMS
-from custom_components.starling_home_hub.integrations.thermostat import THERMOSTAT_PLATFORMS
-from custom_components.starling_home_hub.integrations.valve import VALVE_PLATFORMS
-
-DEVICE_CATEGORIES_TO_PLATFORMS = {
-    "cam": CAMERA_PLATFORMS,
-    "diffuser": DIFFUSER_PLATFORMS,
-    "fan": FAN_PLATFORMS,
-    "garage": GARAGE_PLATFORMS,
-    "heater_cooler": HEATER_COOLER_PLATFORMS,
-    "home_away_control": HOME_AWAY_CONTROL_PLATFORMS,
-    "humidifier_dehumidifier": HUMIDIFIER_DEHUMIDIFIER_PLATFORMS,
-    "kettle": KETTLE_PLATFORMS,
-    "light": LIGHT_PLATFORMS,
-    "lock": LOCK_PLATFORMS,
-    "open_close": OPEN_CLOSE_PLATFORMS,
-    "outlet": OUTLET_PLATFORMS,
-    "purifier": PURIFIER_PLATFORMS,
-    "robot": ROBOT_PLATFORMS,
-    "sensor": SENSOR_PLATFORMS,
-    "smoke_co_detector": SMOKE_CO_DETECTOR_PLATFORMS,
-    "switch": SWITCH_PLATFORMS,
-    "thermostat": THERMOSTAT_PLATFORMS,
-    "valve": VALVE_PLATFORMS,
+"""Contains home assistant integrations for the Starling Home Hub. These generally align to the different device categories.
+
+Each category's entity descriptions are only imported and built the first time a device of that category is seen.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+# The module describing each device category's entities, and the name of its platforms in that module
+DEVICE_CATEGORY_MODULES: dict[str, tuple[str, str]] = {
+    "cam": ("camera", "CAMERA_PLATFORMS"),
+    "diffuser": ("diffuser", "DIFFUSER_PLATFORMS"),
+    "fan": ("fan", "FAN_PLATFORMS"),
+    "garage": ("garage", "GARAGE_PLATFORMS"),
+    "heater_cooler": ("heater_cooler", "HEATER_COOLER_PLATFORMS"),
+    "home_away_control": ("home_away_control", "HOME_AWAY_CONTROL_PLATFORMS"),
+    "humidifier_dehumidifier": ("humidifier_dehumidifier", "HUMIDIFIER_DEHUMIDIFIER_PLATFORMS"),
+    "kettle": ("kettle", "KETTLE_PLATFORMS"),
+    "light": ("light", "LIGHT_PLATFORMS"),
+    "lock": ("lock", "LOCK_PLATFORMS"),
+    "open_close": ("open_close", "OPEN_CLOSE_PLATFORMS"),
+    "outlet": ("outlet", "OUTLET_PLATFORMS"),
+    "purifier": ("purifier", "PURIFIER_PLATFORMS"),
+    "robot": ("robot", "ROBOT_PLATFORMS"),
+    "sensor": ("sensor", "SENSOR_PLATFORMS"),
+    "smoke_co_detector": ("smoke_co_detector", "SMOKE_CO_DETECTOR_PLATFORMS"),
+    "switch": ("switch", "SWITCH_PLATFORMS"),
+    "thermostat": ("thermostat", "THERMOSTAT_PLATFORMS"),
+    "valve": ("valve", "VALVE_PLATFORMS"),
 }
+
+# The entity descriptions of each category loaded so far, by platform
+DEVICE_CATEGORIES_TO_PLATFORMS: dict[str, dict[Platform, list[Any]]] = {}
+
+
+def load_device_categories(categories: Iterable[str]) -> None:
+    """Import the entity descriptions of any of the categories not yet loaded, skipping unknown categories."""
+    for category in categories:
+        if category in DEVICE_CATEGORIES_TO_PLATFORMS or category not in DEVICE_CATEGORY_MODULES:
+            continue
+
+        module_name, platforms_name = DEVICE_CATEGORY_MODULES[category]
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        DEVICE_CATEGORIES_TO_PLATFORMS[category] = getattr(module, platforms_name)
+
+
+async def async_load_device_categories(hass: HomeAssistant, categories: Iterable[str]) -> None:
+    """Load the entity descriptions of the categories in the import executor, so importing them does not block the event loop."""
+    if missing_categories := {
+        category for category in categories
+        if category in DEVICE_CATEGORY_MODULES and category not in DEVICE_CATEGORIES_TO_PLATFORMS
+    }:
+        await hass.async_add_import_executor_job(load_device_categories, missing_categories)
+
+
+def get_device_category_platforms(category: str) -> dict[Platform, list[Any]]:
+    """Get the entity descriptions of a category by platform, loading them now if they were not loaded up front."""
+    if category not in DEVICE_CATEGORIES_TO_PLATFORMS:
+        load_device_categories([category])
+
+    return DEVICE_CATEGORIES_TO_PLATFORMS.get(category, {})
@@ -1,5 +1,9 @@
 """Specific code for RTSP camera streams."""
 
+from homeassistant.components.stream import HLS_PROVIDER
+from homeassistant.core import callback
+
+from custom_components.starling_home_hub.const import DOMAIN, LOGGER, STREAM_PREWARM_PROPERTIES
 from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
 from custom_components.starling_home_hub.entities.camera import StarlingHomeHubBaseCamera
 
@@ -26,10 +30,35 @@ class StarlingHomeHubRTSPCamera(StarlingHomeHubBaseCamera):
 
     async def stream_source(self) -> str | None:
         """Return the source of the stream."""
-        url = self.get_device().properties["rtspUrl"]
+        url = self.get_device().properties.rtspUrl
 
         if self._rtsp_username and self._rtsp_password:
             url = url.replace(
                 "rtsp://", f"rtsp://{self._rtsp_username}:{self._rtsp_password}@")
 
         return url
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, pre-warming the stream when the doorbell is pushed or a person is seen."""
+        device_changes = self.coordinator.device_changes
+
+        if self.coordinator.prewarm_streams and device_changes is not None:
+            device = self.get_device()
+            changed_keys = device_changes.get(self.device_id, set())
+
+            if device is not None and any(device.properties.get(key) for key in STREAM_PREWARM_PROPERTIES & changed_keys):
+                self.coordinator.config_entry.async_create_background_task(
+                    self.hass, self._async_prewarm_stream(), f"{DOMAIN} prewarm stream {self.device_id}")
+
+        super()._handle_coordinator_update()
+
+    async def _async_prewarm_stream(self) -> None:
+        """Start the stream so it is ready for the first viewer, letting it stop if nobody watches within the grace period."""
+        if (stream := await self.async_create_stream()) is None:
+            return
+
+        LOGGER.debug(f"Pre-warming stream for device {self.device_id}")
+        # Viewers are handed the same HLS output, which keeps the stream running while it is watched
+        stream.add_provider(HLS_PROVIDER, timeout=self.coordinator.prewarm_grace_period)
+        await stream.start()
@@ -0,0 +1,151 @@
+"""Tracks how long requests to the Starling Home Hub take."""
+
+from __future__ import annotations
+
+import math
+
+
+class P2Quantile:
+    """Estimates a quantile of a stream of samples in constant memory, using the P² algorithm."""
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize."""
+        self._quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    @property
+    def value(self) -> float | None:
+        """Return the estimate, None before any samples."""
+        if not self._heights:
+            return None
+
+        if len(self._heights) < 5:
+            heights = sorted(self._heights)
+            return heights[min(len(heights) - 1, math.floor(len(heights) * self._quantile))]
+
+        return self._heights[2]
+
+    def add(self, sample: float) -> None:
+        """Add a sample."""
+        heights = self._heights
+
+        if len(heights) < 5:
+            heights.append(sample)
+            if len(heights) == 5:
+                heights.sort()
+            return
+
+        if sample < heights[0]:
+            heights[0] = sample
+            cell = 0
+        elif sample >= heights[4]:
+            heights[4] = max(heights[4], sample)
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= sample < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Move the middle markers towards their desired positions, bending along a parabola where it stays in order
+        for i in range(1, 4):
+            offset = self._desired[i] - self._positions[i]
+            if (offset >= 1 and self._positions[i + 1] - self._positions[i] > 1) or (
+                offset <= -1 and self._positions[i - 1] - self._positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        self._positions[i + step] - self._positions[i])
+                heights[i] = height
+                self._positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        """Predict a marker's new height with the piecewise parabolic formula."""
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1])
+        )
+
+
+class EndpointLatency:
+    """Latency quantiles of the requests made to one endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.p50 = P2Quantile(0.5)
+        self.p95 = P2Quantile(0.95)
+        self.p99 = P2Quantile(0.99)
+
+    def add(self, latency: float) -> None:
+        """Add how long a request took in seconds."""
+        self.count += 1
+        self.p50.add(latency)
+        self.p95.add(latency)
+        self.p99.add(latency)
+
+    def as_dict(self) -> dict:
+        """Return the quantiles for diagnostics."""
+        return {
+            "count": self.count,
+            "p50": self.p50.value,
+            "p95": self.p95.value,
+            "p99": self.p99.value,
+        }
+
+
+class LatencyTracker:
+    """Tracks request latency per endpoint and derives a timeout for each from its p99.
+
+    Until an endpoint has enough samples its timeout is the ceiling.
+    """
+
+    def __init__(self, multiplier: float, floor: float, ceiling: float, min_samples: int) -> None:
+        """Initialize."""
+        self._multiplier = multiplier
+        self._floor = floor
+        self._ceiling = ceiling
+        self._min_samples = min_samples
+        self._endpoints: dict[str, EndpointLatency] = {}
+
+    def get(self, endpoint: str) -> EndpointLatency:
+        """Return the latency of an endpoint."""
+        if (latency := self._endpoints.get(endpoint)) is None:
+            latency = self._endpoints[endpoint] = EndpointLatency()
+
+        return latency
+
+    def add(self, endpoint: str, latency: float) -> None:
+        """Add how long a request to an endpoint took in seconds."""
+        self.get(endpoint).add(latency)
+
+    def p95(self, endpoint: str) -> float | None:
+        """Return the p95 latency of an endpoint, None until it has enough samples."""
+        latency = self._endpoints.get(endpoint)
+        if latency is None or latency.count < self._min_samples:
+            return None
+
+        return latency.p95.value
+
+    def timeout(self, endpoint: str) -> float:
+        """Return the timeout for the next request to an endpoint."""
+        latency = self._endpoints.get(endpoint)
+        if latency is None or latency.count < self._min_samples:
+            return self._ceiling
+
+        return min(self._ceiling, max(self._floor, latency.p99.value * self._multiplier))
+
+    def as_dict(self) -> dict:
+        """Return the quantiles and timeout of every endpoint for diagnostics."""
+        return {
+            endpoint: {**latency.as_dict(), "timeout": self.timeout(endpoint)}
+            for endpoint, latency in self._endpoints.items()
+        }
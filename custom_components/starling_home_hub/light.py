@@ -1,5 +1,6 @@
 """Support for Starling Home Hub lights."""
 
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -14,10 +15,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
     coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[StarlingHomeHubLightEntity] = []
 
-    for device in filter(lambda device: device[1].properties["type"] == "light" or device[1].properties["category"] == "diffuser", entry.runtime_data.devices.items()):
+    for device_id, _ in coordinator.entity_plan.get(Platform.LIGHT, []):
         entities.append(
             StarlingHomeHubLightEntity(
-                device_id=device[0],
+                device_id=device_id,
                 coordinator=coordinator
             )
         )
@@ -1,15 +1,49 @@
 """Contains all the devices supported by the Starling Home Hub integration."""
 
 from dataclasses import dataclass
+from typing import Any, Self
 
+from custom_components.starling_home_hub.models.api.device.base import BaseDevice
+from custom_components.starling_home_hub.models.api.device.camera import CameraDevice
+from custom_components.starling_home_hub.models.api.device.smoke_detector import SmokeDetectorDevice
+from custom_components.starling_home_hub.models.api.device.thermostat import ThermostatDevice
 
-@dataclass
-class Device[T]:
+# The model a device is parsed into, by its type and otherwise by its category
+DEVICE_TYPE_MODELS: dict[str, type[BaseDevice]] = {
+    "camera": CameraDevice,
+    "smoke_detector": SmokeDetectorDevice,
+    "thermostat": ThermostatDevice,
+}
+DEVICE_CATEGORY_MODELS: dict[str, type[BaseDevice]] = {
+    "cam": CameraDevice,
+    "smoke_co_detector": SmokeDetectorDevice,
+    "thermostat": ThermostatDevice,
+}
+
+
+def parse_device_properties(properties: dict[str, Any]) -> BaseDevice:
+    """Parse the properties of a device into the model for its type or category."""
+    model = DEVICE_TYPE_MODELS.get(properties.get("type")) or DEVICE_CATEGORY_MODELS.get(
+        properties.get("category"), BaseDevice)
+    return model.create_from_dict(properties)
+
+
+@dataclass(slots=True)
+class Device[T: BaseDevice]:
     """Class that reflects a specific device."""
 
     status: str
     properties: T
 
+    @classmethod
+    def create_from_dict(cls, dict_: dict[str, Any]) -> Self:
+        """Create a Device from a device response, parsing its properties once."""
+        return cls(status=dict_["status"], properties=parse_device_properties(dict_["properties"]))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the device as it was sent by the hub."""
+        return {"status": self.status, "properties": dict(self.properties)}
+
 
 @dataclass
 class DeviceUpdate:
@@ -1,19 +1,38 @@
 """This contains the base device class."""
 
 from dataclasses import dataclass
+from typing import Any, Self
 
 
-@dataclass
-class BaseDevice:
-    """Class that reflects a device."""
-
-    type: str
-    category: str
-    id: str
-    name: str
-    model: str
-    roomId: str
-    roomName: str
-    structureId: str
-    structureName: str
-    serialNumber: str
+@dataclass(slots=True, kw_only=True, eq=False)
+class BaseDevice(dict[str, Any]):
+    """Class that reflects a device.
+
+    A device is the dict of the properties the hub sent, so reading it as a mapping is a plain dict
+    lookup. The model's fields are set from those properties for typed reads.
+    """
+
+    type: str | None = None
+    category: str | None = None
+    id: str | None = None
+    name: str | None = None
+    model: str | None = None
+    roomId: str | None = None
+    roomName: str | None = None
+    structureId: str | None = None
+    structureName: str | None = None
+    serialNumber: str | None = None
+    isOnline: bool | None = None
+
+    @classmethod
+    def create_from_dict(cls, properties: dict[str, Any]) -> Self:
+        """Create a device from its properties."""
+        model_fields = cls.__dataclass_fields__
+        device = cls(**{key: value for key, value in properties.items() if key in model_fields})
+        dict.update(device, properties)
+
+        return device
+
+    def with_properties(self, properties: dict[str, Any]) -> Self:
+        """Return a copy of the device with some of its properties changed."""
+        return self.create_from_dict({**self, **properties})
@@ -5,8 +5,23 @@ from dataclasses import dataclass
 from custom_components.starling_home_hub.models.api.device.base import BaseDevice
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, eq=False)
 class CameraDevice(BaseDevice):
     """Class that reflects type=camera."""
 
-    supportsWebRtcStreaming: bool
+    cameraEnabled: bool | None = None
+    batteryLevel: int | None = None
+
+    supportsWebRtcStreaming: bool | None = None
+    rtspStreamingEnabled: bool | None = None
+    rtspUrl: str | None = None
+
+    motionDetected: bool | None = None
+    personDetected: bool | None = None
+    animalDetected: bool | None = None
+    vehicleDetected: bool | None = None
+    soundDetected: bool | None = None
+    doorbellPushed: bool | None = None
+    packageDelivered: bool | None = None
+    packageRetrieved: bool | None = None
+    quietTime: bool | None = None
@@ -5,15 +5,15 @@ from dataclasses import dataclass
 from custom_components.starling_home_hub.models.api.device.base import BaseDevice
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, eq=False)
 class SmokeDetectorDevice(BaseDevice):
     """Class that reflects type=smoke_detector."""
 
-    smokeDetected: bool
-    coDetected: bool
-    batteryStatus: str
-    batteryLevel: int
-    manualTestActive: bool
-    smokeStateDetail: str
-    coLevel: int
-    alarmSilenced: bool
+    smokeDetected: bool | None = None
+    coDetected: bool | None = None
+    batteryStatus: str | None = None
+    batteryLevel: int | None = None
+    manualTestActive: bool | None = None
+    smokeStateDetail: str | None = None
+    coLevel: int | None = None
+    alarmSilenced: bool | None = None
@@ -5,39 +5,37 @@ from dataclasses import dataclass
 from custom_components.starling_home_hub.models.api.device.base import BaseDevice
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, eq=False)
 class ThermostatDevice(BaseDevice):
     """Class that reflects type=thermostat."""
 
-    currentTemperature: float
-    targetTemperature: float
+    currentTemperature: float | None = None
+    targetTemperature: float | None = None
 
-    targetHeatingThresholdTemperature: float
-    targetCoolingThresholdTemperature: float
+    targetHeatingThresholdTemperature: float | None = None
+    targetCoolingThresholdTemperature: float | None = None
 
-    hvacMode: str
-    hvacState: str
+    hvacMode: str | None = None
+    hvacState: str | None = None
 
-    canHeat: bool
-    canCool: bool
-    canHeatCool: bool
-    canHumidify: bool
-    canDehumidify: bool
+    canHeat: bool | None = None
+    canCool: bool | None = None
+    canHeatCool: bool | None = None
+    canHumidify: bool | None = None
+    canDehumidify: bool | None = None
 
-    fanRunning: bool
+    fanRunning: bool | None = None
 
-    ecoMode: bool
+    ecoMode: bool | None = None
 
-    humidityPercent: float
-    targetHumidity: float
-    minTargetHumidity: float
-    maxTargetHumidity: float
+    humidityPercent: float | None = None
+    targetHumidity: float | None = None
+    minTargetHumidity: float | None = None
+    maxTargetHumidity: float | None = None
 
-    presetSelected: str
-    presetsAvailable: str
+    presetSelected: str | None = None
+    presetsAvailable: str | None = None
 
-    backplateTemperature: float
-    sensorSelected: str
-    sensorsAvailable: str
-
-    isOnline: bool
+    backplateTemperature: float | None = None
+    sensorSelected: str | None = None
+    sensorsAvailable: str | None = None
@@ -1,9 +1,26 @@
 """This module contains the CoordinatorData class."""
 
+from __future__ import annotations
+
+import asyncio
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE
+from homeassistant.helpers.entity import EntityDescription
 
-from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.device import Device, DeviceUpdate
 from custom_components.starling_home_hub.models.api.status import Status
+from custom_components.starling_home_hub.models.api.stream import StartStream
+
+if TYPE_CHECKING:
+    # Importing the camera component pulls in stream and http, which only camera platforms need
+    from homeassistant.components.camera import WebRTCSendMessage
+
+# The device and entity description of every entity each platform creates, by platform
+type EntityPlan = dict[Platform, list[tuple[str, EntityDescription]]]
 
 
 @dataclass
@@ -12,4 +29,54 @@ class CoordinatorData:
 
     devices: dict[str, Device]
     status: Status
-    device_snapshots_cache: dict[str, bytes] = field(default_factory=dict)
+    # When each device was last fetched from the hub, devices that failed since keep their last known state
+    device_updated: dict[str, datetime] = field(default_factory=dict)
+    # Devices added, replaced by a changed payload or removed in the latest update, every other device is the same object as before
+    changed_devices: set[str] = field(default_factory=set)
+
+
+@dataclass
+class OptimisticUpdate:
+    """Class that houses a property value the hub accepted but a poll has not yet confirmed."""
+
+    value: Any
+    expires: float
+    # Rolls the value back once it expires, even if no poll runs before then
+    cancel_rollback: CALLBACK_TYPE | None = None
+
+
+@dataclass
+class PendingWrite:
+    """Class that houses a device update waiting to be coalesced and sent to the hub."""
+
+    update: dict
+    future: asyncio.Future[DeviceUpdate]
+
+
+@dataclass
+class CachedSnapshot:
+    """Class that houses a cached camera snapshot and the resized variants made from it."""
+
+    image: bytes
+    digest: str
+    expires: float
+    variants: dict[tuple[int, int], bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Return the size of the snapshot and its variants in bytes."""
+        return len(self.image) + sum(len(variant) for variant in self.variants.values())
+
+
+@dataclass
+class StreamSession:
+    """Class that houses the hub stream negotiated for one WebRTC session."""
+
+    device_id: str
+    session_id: str
+    send_message: WebRTCSendMessage
+    stream: StartStream | None = None
+    expires: float = 0
+    next_extend: float = 0
+    extend_attempts: int = 0
+    closed: bool = False
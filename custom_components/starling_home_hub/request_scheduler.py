@@ -0,0 +1,164 @@
+"""Schedules requests to the Starling Home Hub by priority."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+from custom_components.starling_home_hub.latency import P2Quantile
+
+
+class RequestPriority(IntEnum):
+    """Priorities of requests to the hub, lowest first."""
+
+    USER = 0
+    SNAPSHOT = 1
+    POLL = 2
+
+
+class RequestWaitMetrics:
+    """How long requests of one priority waited for their turn."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.total_wait: float = 0
+        self.max_wait: float = 0
+        self.p95_wait = P2Quantile(0.95)
+
+    def add(self, wait: float) -> None:
+        """Add how long a request waited in seconds."""
+        self.count += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.p95_wait.add(wait)
+
+    def as_dict(self) -> dict:
+        """Return the metrics for diagnostics."""
+        return {
+            "count": self.count,
+            "mean_wait": self.total_wait / self.count if self.count else None,
+            "p95_wait": self.p95_wait.value,
+            "max_wait": self.max_wait,
+        }
+
+
+class RequestScheduler:
+    """Lets requests through to the hub in priority order, at a bounded rate and concurrency.
+
+    A token bucket bounds the overall request rate while allowing short bursts. When the hub
+    is busy, waiting requests are let through user actions first, then snapshots, then polls,
+    and in the order they arrived within a priority.
+    """
+
+    def __init__(self, max_concurrent_requests: int, rate: float, burst: int) -> None:
+        """Initialize."""
+        self._max_concurrent_requests = max_concurrent_requests
+        self._rate = rate
+        self._burst = burst
+        self._tokens: float = burst
+        self._tokens_updated = time.monotonic()
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wake_handle: asyncio.TimerHandle | None = None
+        self._metrics = {priority: RequestWaitMetrics() for priority in RequestPriority}
+
+    @asynccontextmanager
+    async def slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Wait for a request's turn, holding a connection until the block exits."""
+        started = time.monotonic()
+        await self._async_acquire(priority)
+        self._metrics[priority].add(time.monotonic() - started)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def has_free_slot(self) -> bool:
+        """Return whether a request would be let through straight away, with no other request waiting."""
+        return (
+            self._active < self._max_concurrent_requests
+            and not any(not future.done() for _, _, future in self._waiters)
+            and self._refill() >= 1
+        )
+
+    def as_dict(self) -> dict:
+        """Return the queue and wait metrics for diagnostics."""
+        queued = [priority for priority, _, future in self._waiters if not future.done()]
+
+        return {
+            "active_requests": self._active,
+            "tokens": round(self._refill(), 2),
+            "queue_depth": {priority.name.lower(): queued.count(priority) for priority in RequestPriority},
+            "wait": {priority.name.lower(): metrics.as_dict() for priority, metrics in self._metrics.items()},
+        }
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait until a connection and a token are free and no request of a higher priority is waiting."""
+        if not self._waiters and self._try_take():
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Cancelled after being let through, so hand the connection on
+                self._release()
+            raise
+
+    def _refill(self) -> float:
+        """Add the tokens earned since the last refill, returning how many there are."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._tokens_updated) * self._rate)
+        self._tokens_updated = now
+        return self._tokens
+
+    def _try_take(self) -> bool:
+        """Take a connection and a token if both are free."""
+        if self._active >= self._max_concurrent_requests or self._refill() < 1:
+            return False
+
+        self._tokens -= 1
+        self._active += 1
+        return True
+
+    def _release(self) -> None:
+        """Free a connection for the next waiting request."""
+        self._active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Let through as many waiting requests as there are connections and tokens for."""
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            if not self._try_take():
+                break
+
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+        if self._waiters and self._active < self._max_concurrent_requests and self._wake_handle is None:
+            # Out of tokens, try again once the next one has been earned
+            self._wake_handle = asyncio.get_running_loop().call_later(
+                (1 - self._tokens) / self._rate, self._wake)
+
+    def _wake(self) -> None:
+        """Dispatch once a token has been earned."""
+        self._wake_handle = None
+        self._dispatch()
@@ -5,8 +5,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from custom_components.starling_home_hub.const import DOMAIN
-from custom_components.starling_home_hub.entities.sensor import StarlingHomeHubSensorEntity
-from custom_components.starling_home_hub.integrations import DEVICE_CATEGORIES_TO_PLATFORMS
+from custom_components.starling_home_hub.entities.hub import StarlingHomeHubCircuitBreakerSensor
+from custom_components.starling_home_hub.entities.sensor import (DATA_AGE_ENTITY_DESCRIPTION, StarlingHomeHubDataAgeSensor,
+                                                                 StarlingHomeHubSensorEntity)
 from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator, StarlingHomeHubConfigEntry
 
 
@@ -14,20 +15,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: StarlingHomeHubConfigEnt
     """Set up the sensor platform."""
 
     coordinator: StarlingHomeHubDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-    entities: list[StarlingHomeHubSensorEntity] = []
+    entities: list[StarlingHomeHubSensorEntity | StarlingHomeHubDataAgeSensor | StarlingHomeHubCircuitBreakerSensor] = [
+        StarlingHomeHubCircuitBreakerSensor(coordinator)
+    ]
 
-    for device in entry.runtime_data.devices.items():
-        if device[1].properties["category"] in DEVICE_CATEGORIES_TO_PLATFORMS:
-            platforms = DEVICE_CATEGORIES_TO_PLATFORMS[device[1].properties["category"]]
-            if Platform.SENSOR in platforms:
-                for entity_description in platforms[Platform.SENSOR]:
-                    if not entity_description.relevant_fn or entity_description.relevant_fn(device[1].properties):
-                        entities.append(
-                            StarlingHomeHubSensorEntity(
-                                device_id=device[0],
-                                coordinator=coordinator,
-                                entity_description=entity_description
-                            )
-                        )
+    for device_id, entity_description in coordinator.entity_plan.get(Platform.SENSOR, []):
+        entity_class = StarlingHomeHubDataAgeSensor if entity_description is DATA_AGE_ENTITY_DESCRIPTION else StarlingHomeHubSensorEntity
+        entities.append(
+            entity_class(
+                device_id=device_id,
+                coordinator=coordinator,
+                entity_description=entity_description
+            )
+        )
 
     async_add_entities(entities, update_before_add=True)
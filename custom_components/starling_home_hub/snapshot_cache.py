@@ -0,0 +1,159 @@
+"""Caches camera snapshots for the Starling Home Hub."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.starling_home_hub.const import DOMAIN, LOGGER
+from custom_components.starling_home_hub.models.coordinator import CachedSnapshot
+
+
+class SnapshotCache:
+    """Least recently used cache of camera snapshots, bounded by the total size of the images.
+
+    Concurrent requests for the same camera share one fetch. Once a snapshot expires it is
+    still served straight away while a fresh one is fetched in the background. Resized
+    variants are cached alongside the snapshot they were made from, and go with it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        fetch: Callable[[str], Awaitable[bytes]],
+        max_bytes: int,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._fetch = fetch
+        self._max_bytes = max_bytes
+        self._snapshots: OrderedDict[str, CachedSnapshot] = OrderedDict()
+        self._size = 0
+        self._in_flight: dict[str, asyncio.Task[CachedSnapshot]] = {}
+        self._resizes_in_flight: dict[tuple[str, str, int, int], asyncio.Task[bytes]] = {}
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the cached images in bytes."""
+        return self._size
+
+    async def async_get(self, device_id: str, ttl: float, width: int | None = None, height: int | None = None) -> bytes:
+        """Get a snapshot, resized to fit the width and height if both are given."""
+        snapshot = await self._async_get_snapshot(device_id, ttl)
+
+        if width is None or height is None:
+            return snapshot.image
+
+        if (variant := snapshot.variants.get((width, height))) is not None:
+            return variant
+
+        key = (device_id, snapshot.digest, width, height)
+        if (task := self._resizes_in_flight.get(key)) is None:
+            task = self._resizes_in_flight[key] = self._config_entry.async_create_task(
+                self._hass, self._async_resize_and_store(snapshot, device_id, width, height), f"{DOMAIN} resize {device_id}")
+            task.add_done_callback(lambda _: self._resizes_in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _async_get_snapshot(self, device_id: str, ttl: float) -> CachedSnapshot:
+        """Get a snapshot, fetching one if there is none cached."""
+        snapshot = self._snapshots.get(device_id)
+
+        if snapshot is None:
+            LOGGER.debug(f"Fetching new snapshot for device {device_id}")
+            return await asyncio.shield(self._async_fetch(device_id, ttl))
+
+        self._snapshots.move_to_end(device_id)
+
+        if snapshot.expires <= self._hass.loop.time():
+            LOGGER.debug(f"Serving stale snapshot for device {device_id} while fetching a new one")
+            self._async_fetch(device_id, ttl)
+        else:
+            LOGGER.debug(f"Using cached snapshot for device {device_id}")
+
+        return snapshot
+
+    async def _async_resize_and_store(self, snapshot: CachedSnapshot, device_id: str, width: int, height: int) -> bytes:
+        """Resize a snapshot in the executor and cache the variant while the snapshot is still cached."""
+        # Imported here as the camera component is only loaded once a camera platform is set up
+        from homeassistant.components.camera import Image
+        from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+
+        LOGGER.debug(f"Resizing snapshot for device {device_id} to {width}x{height}")
+        variant: bytes = await self._hass.async_add_executor_job(
+            scale_jpeg_camera_image, Image("image/jpeg", snapshot.image), width, height)
+
+        if self._snapshots.get(device_id) is snapshot:
+            snapshot.variants[(width, height)] = variant
+            self._size += len(variant)
+            self._async_evict()
+
+        return variant
+
+    @callback
+    def async_prefetch(self, device_id: str, ttl: float) -> None:
+        """Fetch a new snapshot in the background."""
+        LOGGER.debug(f"Prefetching snapshot for device {device_id}")
+        self._async_fetch(device_id, ttl)
+
+    @callback
+    def async_retain(self, device_ids: Iterable[str]) -> None:
+        """Drop the snapshots of any cameras not in the given devices."""
+        for device_id in self._snapshots.keys() - set(device_ids):
+            self._async_remove(device_id)
+
+    @callback
+    def _async_fetch(self, device_id: str, ttl: float) -> asyncio.Task[CachedSnapshot]:
+        """Start fetching a snapshot, or join the fetch already in flight."""
+        if (task := self._in_flight.get(device_id)) is not None:
+            return task
+
+        task = self._in_flight[device_id] = self._config_entry.async_create_background_task(
+            self._hass, self._async_fetch_and_store(device_id, ttl), f"{DOMAIN} snapshot {device_id}")
+
+        @callback
+        def _async_fetch_done(task: asyncio.Task[CachedSnapshot]) -> None:
+            self._in_flight.pop(device_id, None)
+            if not task.cancelled() and (exception := task.exception()) is not None:
+                LOGGER.debug(f"Failed to fetch snapshot for device {device_id}: {exception}")
+
+        task.add_done_callback(_async_fetch_done)
+
+        return task
+
+    async def _async_fetch_and_store(self, device_id: str, ttl: float) -> CachedSnapshot:
+        """Fetch a snapshot and cache it, replacing the previous snapshot and its variants."""
+        image = await self._fetch(device_id)
+        snapshot = CachedSnapshot(
+            image=image,
+            digest=hashlib.blake2b(image, digest_size=16).hexdigest(),
+            expires=self._hass.loop.time() + ttl,
+        )
+
+        self._async_remove(device_id)
+
+        if snapshot.size <= self._max_bytes:
+            self._snapshots[device_id] = snapshot
+            self._size += snapshot.size
+            self._async_evict()
+
+        return snapshot
+
+    @callback
+    def _async_evict(self) -> None:
+        """Evict the least recently used snapshots until the cache is within its budget."""
+        while self._size > self._max_bytes:
+            self._async_remove(next(iter(self._snapshots)))
+
+    @callback
+    def _async_remove(self, device_id: str) -> None:
+        """Remove a snapshot from the cache."""
+        if (snapshot := self._snapshots.pop(device_id, None)) is not None:
+            self._size -= snapshot.size
@@ -0,0 +1,192 @@
+"""Manages WebRTC stream sessions for the Starling Home Hub."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_at
+
+from custom_components.starling_home_hub.api import StarlingHomeHubApiClient
+from custom_components.starling_home_hub.const import (DOMAIN, LOGGER, STREAM_EXTEND_BATCH_WINDOW, STREAM_EXTEND_LEAD,
+                                                       STREAM_EXTEND_RETRY_INTERVAL, STREAM_EXTEND_RETRY_MAX_INTERVAL, STREAM_LIFETIME)
+from custom_components.starling_home_hub.models.api.stream import StartStream
+from custom_components.starling_home_hub.models.coordinator import StreamSession
+
+if TYPE_CHECKING:
+    from homeassistant.components.camera import WebRTCSendMessage
+
+
+class StreamLimitReachedError(HomeAssistantError):
+    """Exception to indicate the hub is already serving as many streams as it may."""
+
+
+class StreamSessionManager:
+    """Keeps one hub stream per WebRTC session, so viewers of the same camera do not affect each other.
+
+    The hub answers each SDP offer with its own stream, so every session negotiates its own
+    stream and stopping one leaves the others running. The number of streams open against
+    the hub at once is capped.
+
+    All streams are extended from a single timer that fires shortly before the earliest one
+    expires, extending every stream that falls due around the same time in one batch.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        client: StarlingHomeHubApiClient,
+        max_streams: int,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._client = client
+        self._max_streams = max_streams
+        self._sessions: dict[tuple[str, str], StreamSession] = {}
+        self._extend_unsub: CALLBACK_TYPE | None = None
+
+    def viewers(self, device_id: str) -> int:
+        """Return how many sessions are open for a camera."""
+        return sum(1 for session_device_id, _ in self._sessions if session_device_id == device_id)
+
+    async def async_open(self, device_id: str, session_id: str, sdp_offer: str, send_message: WebRTCSendMessage) -> StartStream:
+        """Start a stream for a session, answering its offer."""
+        if len(self._sessions) >= self._max_streams:
+            raise StreamLimitReachedError(
+                f"The hub is already serving {self._max_streams} streams")
+
+        session = self._sessions[(device_id, session_id)] = StreamSession(
+            device_id=device_id, session_id=session_id, send_message=send_message)
+
+        try:
+            stream = await self._client.async_start_stream(device_id=device_id, sdp_offer=sdp_offer)
+        except Exception:
+            self._sessions.pop((device_id, session_id), None)
+            raise
+
+        session.stream = stream
+
+        if session.closed:
+            # The viewer left while the hub was still starting the stream
+            self._async_stop(session)
+        else:
+            LOGGER.debug(f"Started stream {stream.streamId} for device {device_id}, {self.viewers(device_id)} viewer(s)")
+            self._async_set_expiry(session)
+            self._async_schedule_extensions()
+
+        return stream
+
+    @callback
+    def async_close(self, device_id: str, session_id: str) -> None:
+        """Close a session, stopping its stream."""
+        if (session := self._sessions.pop((device_id, session_id), None)) is None:
+            return
+
+        session.closed = True
+        if session.stream is not None:
+            self._async_stop(session)
+
+        self._async_schedule_extensions()
+
+    @callback
+    def async_close_device(self, device_id: str) -> None:
+        """Close every session for a camera."""
+        for session_device_id, session_id in list(self._sessions):
+            if session_device_id == device_id:
+                self.async_close(session_device_id, session_id)
+
+    @callback
+    def _async_stop(self, session: StreamSession) -> None:
+        """Stop the stream of a session in the background."""
+
+        async def _async_stop_stream() -> None:
+            LOGGER.debug(f"Stopping stream {session.stream.streamId} for device {session.device_id}")
+            try:
+                await self._client.async_stop_stream(device_id=session.device_id, stream_id=session.stream.streamId)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.warning(f"Failed to stop stream: {err}")
+
+        self._config_entry.async_create_background_task(
+            self._hass, _async_stop_stream(), f"{DOMAIN} stop stream {session.device_id}")
+
+    @callback
+    def _async_set_expiry(self, session: StreamSession) -> None:
+        """Record that the stream of a session was just started or extended."""
+        session.expires = self._hass.loop.time() + STREAM_LIFETIME
+        session.next_extend = session.expires - STREAM_EXTEND_LEAD
+        session.extend_attempts = 0
+
+    @callback
+    def _async_schedule_extensions(self) -> None:
+        """Set the timer to fire when the next stream is due to be extended."""
+        if self._extend_unsub is not None:
+            self._extend_unsub()
+            self._extend_unsub = None
+
+        next_extend = min((session.next_extend for session in self._sessions.values()
+                          if session.stream is not None), default=math.inf)
+
+        if next_extend != math.inf:
+            self._extend_unsub = async_call_at(
+                self._hass, self._async_run_extensions, next_extend)
+
+    @callback
+    def _async_run_extensions(self, _: datetime) -> None:
+        """Extend every stream that is due, or nearly due, in one batch."""
+        self._extend_unsub = None
+        batch_end = self._hass.loop.time() + STREAM_EXTEND_BATCH_WINDOW
+
+        due_sessions = [
+            session for session in self._sessions.values()
+            if session.stream is not None and session.next_extend <= batch_end
+        ]
+
+        for session in due_sessions:
+            # Not due again until this extension finishes
+            session.next_extend = math.inf
+
+        self._async_schedule_extensions()
+
+        async def _async_extend_batch() -> None:
+            LOGGER.debug(f"Extending {len(due_sessions)} stream(s)")
+            await asyncio.gather(*(self._async_extend(session) for session in due_sessions))
+            self._async_schedule_extensions()
+
+        self._config_entry.async_create_background_task(
+            self._hass, _async_extend_batch(), f"{DOMAIN} extend streams")
+
+    async def _async_extend(self, session: StreamSession) -> None:
+        """Extend the stream of a session, retrying with backoff until it expires."""
+        try:
+            await self._client.async_extend_stream(device_id=session.device_id, stream_id=session.stream.streamId)
+        except Exception as err:  # pylint: disable=broad-except
+            if session.closed:
+                return
+
+            session.extend_attempts += 1
+            retry_in = min(STREAM_EXTEND_RETRY_INTERVAL * 2 ** (session.extend_attempts - 1),
+                           STREAM_EXTEND_RETRY_MAX_INTERVAL)
+
+            if self._hass.loop.time() + retry_in < session.expires:
+                LOGGER.debug(f"Failed to extend stream, retrying in {retry_in}s: {err}")
+                session.next_extend = self._hass.loop.time() + retry_in
+                return
+
+            # A new stream needs a new offer, so the frontend is asked to negotiate again. Imported here as the
+            # camera component is only loaded once a camera platform is set up
+            from homeassistant.components.camera import WebRTCError
+
+            LOGGER.warning(f"Failed to extend stream for device {session.device_id} before it expired: {err}")
+            session.send_message(WebRTCError("stream_expired", str(err)))
+            self.async_close(session.device_id, session.session_id)
+            return
+
+        if not session.closed:
+            self._async_set_expiry(session)
@@ -1,10 +1,18 @@
 """A mock server to simulate a Starling Home Hub API using Flask."""
 
 import json
+import os
+import time
 from flask import Flask, jsonify, request
 
 app = Flask(__name__)
 
+# Seconds to delay every response by, to simulate a slow hub (e.g. MOCK_LATENCY=0.2)
+LATENCY = float(os.environ.get('MOCK_LATENCY', '0'))
+
+# Number of copies of each stubbed device to list, to simulate a large house (e.g. MOCK_DEVICE_COPIES=12)
+DEVICE_COPIES = int(os.environ.get('MOCK_DEVICE_COPIES', '1'))
+
 
 def load_stub(stub_name):
     """Load a stub JSON file."""
@@ -13,6 +21,13 @@ def load_stub(stub_name):
     return stub
 
 
+@app.before_request
+def inject_latency():
+    """Delay the response to simulate network and hub latency."""
+    if LATENCY:
+        time.sleep(LATENCY)
+
+
 @app.get('/status')
 def get_status():
     """Get the status of the Starling Home Hub."""
@@ -22,13 +37,27 @@ def get_status():
 @app.get('/devices')
 def get_devices():
     """Get a list of all devices."""
-    return jsonify(load_stub('devices'))
+    devices = load_stub('devices')
+
+    if DEVICE_COPIES > 1:
+        devices['devices'] = [
+            {**device, 'id': f"{device['id']}.{copy}"}
+            for device in devices['devices']
+            for copy in range(DEVICE_COPIES)
+        ]
+
+    return jsonify(devices)
+
+
+def stub_id(device_id):
+    """Map a copied device ID back to the stub it was copied from."""
+    return device_id.split('.')[0]
 
 
 @app.get('/devices/<device_id>')
 def get_device(device_id):
     """Get a specific device by ID."""
-    return jsonify(load_stub(f'device/{device_id}'))
+    return jsonify(load_stub(f'device/{stub_id(device_id)}'))
 
 
 @app.post('/devices/<device_id>')
@@ -36,6 +65,7 @@ def update_device(device_id):
     """Update a specific device by ID."""
 
     request_body = request.json
+    device_id = stub_id(device_id)
 
     # Check if device exists
     try:
@@ -0,0 +1 @@
+"""Tests for the Starling Home Hub integration."""
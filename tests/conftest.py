@@ -0,0 +1,108 @@
+"""Fixtures for the Starling Home Hub tests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_API_KEY, CONF_URL
+from homeassistant.core import HomeAssistant
+
+from custom_components.starling_home_hub.api import StarlingHomeHubApiClient, StarlingHomeHubApiClientCommunicationError
+from custom_components.starling_home_hub.circuit_breaker import CircuitBreaker
+from custom_components.starling_home_hub.const import CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT, DOMAIN
+from custom_components.starling_home_hub.coordinator import StarlingHomeHubDataUpdateCoordinator
+from custom_components.starling_home_hub.models.api.device import Device, DeviceUpdate
+from custom_components.starling_home_hub.models.api.status import Status
+
+
+def make_device(device_id: str, category: str = "switch", **properties: Any) -> dict[str, Any]:
+    """Make the properties of a device as the hub sends them."""
+    return {
+        "type": category, "category": category, "id": device_id, "name": device_id, "model": "Synthetic",
+        "roomId": "room", "roomName": "Room", "structureId": "structure", "structureName": "Home",
+        "serialNumber": device_id, "isOnline": True, **properties,
+    }
+
+
+class FakeClient:
+    """Stands in for the API client, answering from a dict of device properties."""
+
+    raise_for_set_status = staticmethod(StarlingHomeHubApiClient.raise_for_set_status)
+
+    def __init__(self, devices: dict[str, dict[str, Any]]) -> None:
+        """Initialize."""
+        self.devices = devices
+        self.circuit_breaker = CircuitBreaker(CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT)
+        # Set to make the hub stop answering, or to stop answering reads of some devices
+        self.fail_hub = False
+        self.fail_devices: set[str] = set()
+        # Set to have the hub accept writes without applying them
+        self.apply_writes = True
+
+    def _raise_if_failing(self, device_id: str | None = None) -> None:
+        """Raise like the client does when the hub does not answer."""
+        if self.fail_hub or device_id in self.fail_devices:
+            raise StarlingHomeHubApiClientCommunicationError("Error fetching information")
+
+    async def async_get_devices(self) -> list[dict[str, Any]]:
+        """Get the list of devices."""
+        self._raise_if_failing()
+        return [{"id": device_id, "category": properties["category"]} for device_id, properties in self.devices.items()]
+
+    async def async_get_status(self) -> Status:
+        """Get the status of the hub."""
+        self._raise_if_failing()
+        return Status(apiVersion=2, apiReady=True, appName="Tests", permissions={"read": True, "write": True})
+
+    async def async_get_device_if_changed(self, device_id: str, digest: str | None, **_: Any) -> tuple[str, Device | None]:
+        """Get a device, only parsing it if its payload no longer matches the digest."""
+        self._raise_if_failing(device_id)
+        payload = json.dumps({"status": "OK", "properties": self.devices[device_id]}).encode()
+        payload_digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+        return payload_digest, None if payload_digest == digest else Device.create_from_dict(json.loads(payload))
+
+    async def async_update_device(self, device_id: str, update: dict, **_: Any) -> DeviceUpdate:
+        """Update a device, accepting every property."""
+        self._raise_if_failing()
+        if self.apply_writes:
+            self.devices[device_id].update(update)
+
+        return DeviceUpdate(status="OK", setStatus=dict.fromkeys(update, "OK"))
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path) -> AsyncIterator[HomeAssistant]:
+    """Run a bare Home Assistant instance for a test."""
+    hass = HomeAssistant(str(tmp_path))
+    await hass.async_start()
+
+    yield hass
+
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    """Make a fake client for a hub with a couple of switches."""
+    return FakeClient({"switch-1": make_device("switch-1"), "switch-2": make_device("switch-2")})
+
+
+@pytest.fixture
+def make_coordinator(hass: HomeAssistant, client: FakeClient):
+    """Make a coordinator for the fake hub with the given options, coordinators made in a test share their saved data."""
+
+    def _make_coordinator(**options: Any) -> StarlingHomeHubDataUpdateCoordinator:
+        entry = ConfigEntry(
+            data={CONF_URL: "http://hub.local/api/connect/v2/", CONF_API_KEY: "key"}, discovery_keys={}, domain=DOMAIN,
+            entry_id="hub", minor_version=0, options=options, source="user", subentries_data=None, title="Hub", unique_id=None, version=2,
+        )
+        return StarlingHomeHubDataUpdateCoordinator(hass=hass, client=client, config_entry=entry)
+
+    return _make_coordinator
@@ -0,0 +1,95 @@
+"""Tests for the Starling Home Hub API client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from custom_components.starling_home_hub.api import (StarlingHomeHubApiClient, StarlingHomeHubApiClientCircuitOpenError,
+                                                     StarlingHomeHubApiClientError)
+from custom_components.starling_home_hub.const import REQUEST_TIMEOUT_MIN_SAMPLES
+
+
+class FakeResponse:
+    """A successful response from the hub."""
+
+    status = 200
+
+    def __init__(self, body: bytes = b'{"status": "OK"}') -> None:
+        """Initialize."""
+        self.body = body
+
+    def raise_for_status(self) -> None:
+        """Raise nothing, the request succeeded."""
+
+    async def json(self) -> dict[str, Any]:
+        """Return the body."""
+        return json.loads(self.body)
+
+    async def read(self) -> bytes:
+        """Return the raw body."""
+        return self.body
+
+
+class FakeSession:
+    """Answers every request after a constant latency."""
+
+    def __init__(self, latency: float = 0, body: bytes = b'{"status": "OK"}') -> None:
+        """Initialize."""
+        self.latency = latency
+        self.body = body
+        self.requests = 0
+
+    async def request(self, **_: Any) -> FakeResponse:
+        """Answer a request."""
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return FakeResponse(self.body)
+
+
+@pytest.mark.asyncio
+async def test_time_waiting_for_a_slot_does_not_trigger_hedges() -> None:
+    """Requests queued behind the concurrency limit are not hedged when the hub itself answers in constant time."""
+    session = FakeSession(latency=0.05)
+    client = StarlingHomeHubApiClient(
+        url="http://hub.local/api/connect/v2/", api_key="key", session=session, max_concurrent_requests=4, hedge_requests=True)
+
+    for _ in range(REQUEST_TIMEOUT_MIN_SAMPLES):
+        client.latency.add("GET status", session.latency)
+
+    await asyncio.gather(*(client._api_wrapper(method="get", url=client.get_api_url_for_endpoint("status")) for _ in range(60)))
+
+    assert client.hedged_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_malformed_device_payload_raises_client_error() -> None:
+    """A device payload that cannot be parsed fails like any other bad response from the hub."""
+    client = StarlingHomeHubApiClient(url="http://hub.local/api/connect/v2/", api_key="key", session=FakeSession(body=b"{not json"))
+
+    with pytest.raises(StarlingHomeHubApiClientError):
+        await client.async_get_device_if_changed("switch-1", None)
+
+
+@pytest.mark.asyncio
+async def test_request_rejected_by_the_circuit_breaker_is_not_retried(monkeypatch: pytest.MonkeyPatch) -> None:
+    """While the half open breaker's trial request is in flight, other requests fail at once instead of retrying."""
+    session = FakeSession()
+    client = StarlingHomeHubApiClient(url="http://hub.local/api/connect/v2/", api_key="key", session=session)
+    for _ in range(client.circuit_breaker._failure_threshold):
+        client.circuit_breaker.record_failure()
+    monkeypatch.setattr(client.circuit_breaker, "_reset_timeout", 0)
+    assert client.circuit_breaker.allow_request()
+
+    allow_request = client.circuit_breaker.allow_request
+    allowed: list[bool] = []
+    monkeypatch.setattr(client.circuit_breaker, "allow_request", lambda: allowed.append(allow_request()) or allowed[-1])
+
+    with pytest.raises(StarlingHomeHubApiClientCircuitOpenError):
+        await client._api_wrapper(method="get", url=client.get_api_url_for_endpoint("status"))
+
+    assert allowed == [False]
+    assert session.requests == 0
@@ -0,0 +1,207 @@
+"""Tests for the Starling Home Hub data update coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.starling_home_hub.entities.switch import (StarlingHomeHubSwitchEntity,
+                                                                 StarlingHomeHubSwitchEntityDescription)
+
+from .conftest import make_device
+
+
+class RecordingSwitchEntity(StarlingHomeHubSwitchEntity):
+    """A switch that records the availability it writes, as it has no platform to write its state to."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.written: list[bool] = []
+
+    def async_write_ha_state(self) -> None:
+        """Record the availability the entity would write."""
+        self.written.append(self.available)
+
+
+async def add_switch(hass: HomeAssistant, coordinator, device_id: str) -> RecordingSwitchEntity:
+    """Add a switch entity for a device, listening to the coordinator."""
+    entity = RecordingSwitchEntity(
+        device_id=device_id,
+        coordinator=coordinator,
+        entity_description=StarlingHomeHubSwitchEntityDescription(
+            key="online", value_fn=lambda properties: properties["isOnline"]),
+    )
+    entity.hass = hass
+    await entity.async_added_to_hass()
+
+    return entity
+
+
+async def fail_refresh(coordinator) -> None:
+    """Refresh with every device due, while the hub is not answering."""
+    coordinator._next_device_poll = dict.fromkeys(coordinator._next_device_poll, 0)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+
+@pytest.mark.asyncio
+async def test_entity_goes_unavailable_through_an_outage(hass: HomeAssistant, client, make_coordinator) -> None:
+    """Devices that go stale while every poll fails are written unavailable."""
+    coordinator = make_coordinator(stale_threshold=0.2)
+    await coordinator.async_refresh()
+    entity = await add_switch(hass, coordinator, "switch-1")
+
+    client.fail_hub = True
+    await fail_refresh(coordinator)
+    await fail_refresh(coordinator)
+    assert entity.written == []
+
+    await asyncio.sleep(0.3)
+    await fail_refresh(coordinator)
+    assert entity.written == [False]
+
+    client.fail_hub = False
+    coordinator._next_device_poll = dict.fromkeys(coordinator._next_device_poll, 0)
+    await coordinator.async_refresh()
+    assert entity.written == [False, True]
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_one_failing_device_does_not_fail_the_update(hass: HomeAssistant, client, make_coordinator) -> None:
+    """A device that fails on its own keeps its last known state without failing the whole update."""
+    coordinator = make_coordinator()
+    await coordinator.async_refresh()
+
+    client.fail_devices = {"switch-1"}
+    coordinator._next_device_poll = dict.fromkeys(coordinator._next_device_poll, 0)
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert "switch-1" in coordinator.data.devices
+
+    client.fail_devices = {"switch-1", "switch-2"}
+    coordinator._next_device_poll = dict.fromkeys(coordinator._next_device_poll, 0)
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_update_keeps_failing_through_an_outage_on_tiered_polls(hass: HomeAssistant, client, make_coordinator) -> None:
+    """Ticks that poll only some devices, or none, keep failing while the hub is not answering."""
+    client.devices["lock-1"] = make_device("lock-1", "lock")
+    coordinator = make_coordinator(fast_poll_categories=["lock"], slow_poll_categories=[])
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+    client.fail_hub = True
+    recoveries = 0
+
+    # The device list is not due again for a while, so each tick polls the fast lock or nothing at all
+    for lock_due in (True, False, True, False, False, True):
+        if lock_due:
+            coordinator._next_device_poll["lock-1"] = 0
+        await coordinator.async_refresh()
+        recoveries += coordinator.last_update_success
+        assert coordinator.device_changes is not None
+
+    assert recoveries == 0
+
+    client.fail_hub = False
+    coordinator._next_device_poll["lock-1"] = 0
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_restored_stale_device_becomes_available(hass: HomeAssistant, client, make_coordinator) -> None:
+    """A device restored from data saved too long ago is written available once the hub answers."""
+    saved = make_coordinator()
+    await saved.async_refresh()
+    await saved.async_shutdown()
+    await saved._store.async_save({
+        **saved._data_to_store(),
+        "device_updated": dict.fromkeys(saved.data.devices, (dt_util.utcnow() - timedelta(hours=1)).isoformat()),
+    })
+
+    coordinator = make_coordinator()
+    assert await coordinator.async_restore_data()
+    entity = await add_switch(hass, coordinator, "switch-1")
+    assert not entity.available
+
+    await coordinator.async_refresh()
+    assert entity.written == [True]
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_optimistic_update_rolls_back_without_a_poll(hass: HomeAssistant, client, make_coordinator) -> None:
+    """An optimistic value the hub never confirms is rolled back once it expires, even while every poll fails."""
+    coordinator = make_coordinator(optimistic_timeout=0.1)
+    await coordinator.async_refresh()
+    entity = await add_switch(hass, coordinator, "switch-1")
+
+    client.apply_writes = False
+    await coordinator.update_device("switch-1", {"isOnline": False})
+    assert coordinator.data.devices["switch-1"].properties.isOnline is False
+
+    client.fail_hub = True
+    await fail_refresh(coordinator)
+    await asyncio.sleep(0.2)
+
+    assert coordinator.data.devices["switch-1"].properties.isOnline is True
+    assert not coordinator.is_in_transition("switch-1")
+    assert len(entity.written) == 2
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_succeeds_when_the_refresh_after_it_fails(hass: HomeAssistant, client, make_coordinator) -> None:
+    """A write the hub applied is reported as done even if reading the device back fails."""
+    coordinator = make_coordinator(optimistic_timeout=0)
+    await coordinator.async_refresh()
+
+    client.fail_devices = {"switch-1"}
+    device_update = await coordinator.update_device("switch-1", {"isOnline": False})
+
+    assert device_update.setStatus == {"isOnline": "OK"}
+    assert client.devices["switch-1"]["isOnline"] is False
+
+    await coordinator.async_shutdown()
+
+
+@pytest.mark.asyncio
+async def test_poll_without_changes_saves_when_devices_were_updated(hass: HomeAssistant, client, make_coordinator) -> None:
+    """Polls that change nothing still save when devices were last updated, so a restart restores them as fresh."""
+    saved = make_coordinator()
+    await saved.async_refresh()
+    await saved.async_shutdown()
+    saved_updated = dt_util.utcnow() - timedelta(seconds=30)
+    await saved._store.async_save({
+        **saved._data_to_store(),
+        "device_updated": dict.fromkeys(saved.data.devices, saved_updated.isoformat()),
+    })
+
+    coordinator = make_coordinator()
+    assert await coordinator.async_restore_data()
+    await coordinator.async_refresh()
+    assert coordinator.device_changes == {}
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    stored_data = await coordinator._store.async_load()
+    assert dt_util.parse_datetime(stored_data["device_updated"]["switch-1"]) > saved_updated
+
+    await coordinator.async_shutdown()
@@ -0,0 +1,40 @@
+"""Tests for planning the entities of a Starling Home Hub's devices."""
+
+from __future__ import annotations
+
+from homeassistant.const import Platform
+
+from custom_components.starling_home_hub.entities.sensor import DATA_AGE_ENTITY_DESCRIPTION
+from custom_components.starling_home_hub.entity_plan import DEVICE_ENTITY_DESCRIPTION, build_entity_plan, get_platforms
+from custom_components.starling_home_hub.models.api.device import Device
+
+from .conftest import make_device
+
+
+def test_only_devices_with_entities_get_a_data_age_sensor() -> None:
+    """A device of a category without entities gets no data age sensor, and sets up no platforms."""
+    devices = {
+        device_id: Device.create_from_dict({"status": "OK", "properties": make_device(device_id, category)})
+        for device_id, category in (("switch-1", "switch"), ("gadget-1", "gadget"), ("cam-1", "cam"))
+    }
+
+    entity_plan = build_entity_plan(devices)
+
+    assert [
+        device_id for device_id, entity_description in entity_plan[Platform.SENSOR]
+        if entity_description is DATA_AGE_ENTITY_DESCRIPTION
+    ] == ["switch-1", "cam-1"]
+    assert get_platforms(build_entity_plan({"gadget-1": devices["gadget-1"]})) == [Platform.SENSOR]
+
+
+def test_devices_matched_by_a_platform_filter_are_planned() -> None:
+    """Platforms that create an entity per matching device find their devices in the plan."""
+    devices = {
+        device_id: Device.create_from_dict({"status": "OK", "properties": make_device(device_id, category, type=device_type)})
+        for device_id, category, device_type in (("light-1", "light", "light"), ("light-2", "light", "switch"))
+    }
+
+    entity_plan = build_entity_plan(devices)
+
+    assert entity_plan[Platform.LIGHT] == [("light-1", DEVICE_ENTITY_DESCRIPTION)]
+    assert Platform.LIGHT in get_platforms(entity_plan)
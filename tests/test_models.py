@@ -0,0 +1,54 @@
+"""Tests for the Starling Home Hub device models."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.starling_home_hub.models.api.device import Device
+from custom_components.starling_home_hub.models.api.device.thermostat import ThermostatDevice
+
+from .conftest import make_device
+
+
+@pytest.mark.parametrize("key", ["currentTemperature", "notModelled"])
+def test_null_property_reads_like_a_dict(key: str) -> None:
+    """A property sent as null reads as None, whether or not the model has a field for it."""
+    properties = make_device("thermostat-1", "thermostat", **{key: None})
+    device = Device.create_from_dict({"status": "OK", "properties": properties}).properties
+
+    assert isinstance(device, ThermostatDevice)
+    assert key in device
+    assert device[key] is None
+    assert device.get(key, "default") is None
+    assert dict(device) == properties
+    assert dict(device.with_properties({"name": "Renamed"})) == {**properties, "name": "Renamed"}
+
+
+@pytest.mark.parametrize("key", ["currentTemperature", "notModelled"])
+def test_absent_property_reads_like_a_dict(key: str) -> None:
+    """A property the hub did not send is missing, whether or not the model has a field for it."""
+    properties = make_device("thermostat-1", "thermostat")
+    device = Device.create_from_dict({"status": "OK", "properties": properties}).properties
+
+    assert key not in device
+    assert device.get(key, "default") == "default"
+    with pytest.raises(KeyError):
+        device[key]
+    assert dict(device) == properties
+
+
+def test_null_modelled_property_reads_as_none_attribute() -> None:
+    """A modelled property sent as null is still None when read as an attribute."""
+    properties = make_device("thermostat-1", "thermostat", currentTemperature=None)
+    device = Device.create_from_dict({"status": "OK", "properties": properties}).properties
+
+    assert device.currentTemperature is None
+
+
+def test_devices_compare_by_their_properties() -> None:
+    """Devices are equal when the hub sent the same properties, which is how changes are found between polls."""
+    properties = make_device("thermostat-1", "thermostat", currentTemperature=20.5)
+    device = Device.create_from_dict({"status": "OK", "properties": properties}).properties
+
+    assert device == Device.create_from_dict({"status": "OK", "properties": dict(properties)}).properties
+    assert device != device.with_properties({"currentTemperature": 21.0})